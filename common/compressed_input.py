@@ -0,0 +1,147 @@
+"""
+Compressed Input Helpers
+
+Readers shared by the exercise libraries (statistics_core,
+conversion_core and word_count_core): open_text_input opens a plain,
+gzip, bzip2 or xz text file, decompressing it in a background thread
+while it is read. Nothing here prints or exits.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import importlib
+import io
+import queue
+import threading
+
+# Size of each buffered read (and of each decompressed block)
+READ_BUFFER_SIZE = 1024 * 1024
+# Decompressed blocks the background thread may queue ahead of the reader
+DECOMPRESS_QUEUE_BLOCKS = 4
+# Magic bytes identifying compressed inputs and the module that reads them
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+)
+
+
+class ThreadedDecompressor(io.RawIOBase):
+    """
+    Raw binary stream fed by a background decompression thread.
+
+    The thread decompresses READ_BUFFER_SIZE blocks ahead of the reader
+    into a small bounded queue, so decompression overlaps with parsing
+    instead of serializing the pipeline.
+    """
+
+    def __init__(self, source):
+        super().__init__()
+        self._source = source
+        self._queue = queue.Queue(maxsize=DECOMPRESS_QUEUE_BLOCKS)
+        self._stop = threading.Event()
+        self._pending = b""
+        self._eof = False
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _put(self, item):
+        """Queue an item, giving up if the reader has been closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _pump(self):
+        """Thread body: decompress blocks until end of stream or close."""
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(READ_BUFFER_SIZE)
+                self._put(block)
+                if not block:
+                    return
+        # Any failure is handed to the reading thread, which re-raises it
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._put(e)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._eof = True
+                raise OSError(f"decompression failed: {item}") from item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = item
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def detect_compression(filename):
+    """
+    Identify a compressed file by its magic bytes.
+
+    Args:
+        filename (str): Path to the file
+
+    Returns:
+        str: Name of the module that reads the file ("gzip", "bz2" or
+             "lzma"), or None for an uncompressed file
+    """
+    with open(filename, "rb") as probe:
+        magic = probe.read(6)
+
+    for prefix, module_name in COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return module_name
+    return None
+
+
+def open_text_input(filename, errors="strict"):
+    """
+    Open a text file for reading, decompressing it on the fly if needed.
+
+    gzip, bzip2 and xz files are recognized by their magic bytes rather
+    than their extension; the matching module is imported only when such
+    a file is seen.
+
+    Args:
+        filename (str): Path to a plain or compressed text file
+        errors (str): How undecodable bytes are handled, as for open()
+
+    Returns:
+        file: Text stream (UTF-8) over the decompressed contents
+    """
+    module_name = detect_compression(filename)
+    if module_name is None:
+        return open(
+            filename,
+            "r",
+            encoding="utf-8",
+            errors=errors,
+            buffering=READ_BUFFER_SIZE,
+        )
+
+    module = importlib.import_module(module_name)
+    raw = ThreadedDecompressor(module.open(filename, "rb"))
+    return io.TextIOWrapper(
+        io.BufferedReader(raw, READ_BUFFER_SIZE), encoding="utf-8", errors=errors
+    )
@@ -0,0 +1 @@
+../common/compressed_input.py
\ No newline at end of file
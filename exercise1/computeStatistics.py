@@ -13,184 +13,187 @@ Note: Module name 'computeStatistics' is required by assignment specification
 
 # pylint: disable=invalid-name
 
+import argparse
+import itertools
 import sys
 import time
 
-
-def read_numbers_from_file(filename):
+from statistics_core import (
+    BINNING_SCALES,
+    QUANTILE_SAMPLE_SIZE,
+    build_histogram,
+    calculate_std_deviation,
+    compute_bin_edges,
+    compute_statistics,
+    estimate_binned_mode,
+    iter_numbers_from_file,
+    iter_sliding_windows,
+    iter_time_buckets,
+    parse_finite_number,
+    parse_timestamped_line,
+    summarize_stream,
+)
+
+
+class InvalidLineReporter:
+    """Console sink for lines skipped by the reader."""
+
+    def __init__(self):
+        self.count = 0
+
+    def report(self, line_number, line):
+        """
+        Print a warning for a skipped line.
+
+        Args:
+            line_number (int): 1-based line number
+            line (str): Stripped content of the line
+        """
+        self.count += 1
+        print(f"Warning: Invalid data at line {line_number}: '{line}' - Skipping")
+
+    def print_summary(self):
+        """Print the number of skipped lines, if any."""
+        if self.count > 0:
+            print(f"\nTotal invalid entries skipped: {self.count}\n")
+
+
+def stream_numbers(filename, parse=float, report=True):
     """
-    Read numbers from a file and return a list of valid numbers.
+    Read numbers for the CLI, reporting problems on the console.
 
     Args:
         filename (str): Path to the file containing numbers
+        parse (callable): Converts a stripped line into a value
+        report (bool): Print warnings for skipped lines (disable on
+            repeated passes over the same file)
 
-    Returns:
-        list: List of valid numbers (float)
+    Yields:
+        Parsed value for each valid line (exits the program on I/O errors)
     """
-    numbers = []
-    invalid_count = 0
-
+    reporter = InvalidLineReporter()
+    values = iter_numbers_from_file(
+        filename, parse, reporter.report if report else None
+    )
     try:
-        with open(filename, "r", encoding="utf-8") as file:
-            for line_number, line in enumerate(file, 1):
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        number = float(line)
-                        numbers.append(number)
-                    except ValueError:
-                        invalid_count += 1
-                        print(
-                            f"Warning: Invalid data at line {line_number}: "
-                            f"'{line}' - Skipping"
-                        )
-
-        if invalid_count > 0:
-            print(f"\nTotal invalid entries skipped: {invalid_count}\n")
-
+        yield from values
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
     except (IOError, OSError) as e:
         print(f"Error reading file: {e}")
         sys.exit(1)
-
-    return numbers
-
-
-def calculate_mean(numbers):
-    """
-    Calculate the arithmetic mean of a list of numbers.
-
-    Args:
-        numbers (list): List of numbers
-
-    Returns:
-        float: Mean value
-    """
-    if not numbers:
-        return 0.0
-    return sum(numbers) / len(numbers)
+    reporter.print_summary()
 
 
-def calculate_median(numbers):
+def format_mode(modes):
     """
-    Calculate the median of a list of numbers.
+    Format mode list for display.
 
     Args:
-        numbers (list): List of numbers
+        modes (list): List of mode values
 
     Returns:
-        float: Median value
+        str: Formatted mode string
     """
-    if not numbers:
-        return 0.0
-
-    sorted_numbers = sorted(numbers)
-    n = len(sorted_numbers)
-
-    if n % 2 == 0:
-        # Even number of elements: average of two middle values
-        median = (sorted_numbers[n // 2 - 1] + sorted_numbers[n // 2]) / 2
-    else:
-        # Odd number of elements: middle value
-        median = sorted_numbers[n // 2]
-
-    return median
+    if not modes:
+        return "No mode (all values appear once)"
+    if len(modes) == 1:
+        return f"{modes[0]}"
+    return f"Multiple modes: {', '.join(map(str, modes))}"
 
 
-def calculate_mode(numbers):
+def format_bin_label(edges, index):
     """
-    Calculate the mode(s) of a list of numbers.
+    Format a bin as an interval; only the last bin includes its upper edge.
 
     Args:
-        numbers (list): List of numbers
+        edges (list): Bin edges
+        index (int): Index of the bin
 
     Returns:
-        list: List of mode values (can be multiple if multimodal)
+        str: Interval such as "[1, 2)"
     """
-    if not numbers:
-        return []
-
-    # Count frequency of each number
-    frequency = {}
-    for num in numbers:
-        frequency[num] = frequency.get(num, 0) + 1
-
-    # Find maximum frequency
-    max_frequency = max(frequency.values())
-
-    # Find all numbers with maximum frequency
-    modes = [num for num, freq in frequency.items() if freq == max_frequency]
-
-    # If all numbers appear once, there is no mode
-    if max_frequency == 1:
-        return []
-
-    return sorted(modes)
+    closing = "]" if index == len(edges) - 2 else ")"
+    return f"[{edges[index]:.6g}, {edges[index + 1]:.6g}{closing}"
 
 
-def calculate_variance(numbers, mean):
+def format_histogram(edges, counts, modal_index):
     """
-    Calculate the variance of a list of numbers.
+    Format a histogram into a table string.
 
     Args:
-        numbers (list): List of numbers
-        mean (float): Mean of the numbers
+        edges (list): Bin edges
+        counts (list): Count of values in each bin
+        modal_index (int): Index of the modal bin (marked with '*')
 
     Returns:
-        float: Variance value
+        str: Formatted table
     """
-    if len(numbers) < 2:
-        return 0.0
+    labels = [format_bin_label(edges, index) for index in range(len(counts))]
+    label_width = max(max(len(label) for label in labels), len("Bin"))
+    count_width = max(max(len(str(count)) for count in counts), len("Count"))
 
-    # Sum of squared differences from mean
-    squared_diffs = sum((x - mean) ** 2 for x in numbers)
+    separator = "+" + "-" * (label_width + 2) + "+" + "-" * (count_width + 4) + "+"
+    header = f"| {'Bin':<{label_width}} | {'Count':>{count_width}}   |"
 
-    # Population variance (dividing by n)
-    variance = squared_diffs / len(numbers)
+    table = separator + "\n" + header + "\n" + separator + "\n"
+    for index, (label, count) in enumerate(zip(labels, counts)):
+        marker = " *" if index == modal_index else "  "
+        table += f"| {label:<{label_width}} | {count:>{count_width}}{marker} |\n"
+    table += separator
 
-    return variance
+    return table
 
 
-def calculate_std_deviation(variance):
+def format_window_row(label, stats):
     """
-    Calculate the standard deviation from variance.
+    Format one window's statistics as a single output line.
 
     Args:
-        variance (float): Variance value
+        label (str): Window description (positions or time range)
+        stats (dict): Statistics for the window
 
     Returns:
-        float: Standard deviation value
+        str: Formatted line
     """
-    # Manual square root calculation using Newton's method
-    if variance == 0:
-        return 0.0
+    return (
+        f"{label} | count={stats['count']} "
+        f"mean={stats['mean']:.6f} "
+        f"median={stats['median']:.6f} "
+        f"variance={stats['variance']:.6f} "
+        f"std_dev={stats['std_dev']:.6f}"
+    )
 
-    # Initial guess
-    x = variance
-    # Newton's method for square root
-    for _ in range(50):  # Sufficient iterations for convergence
-        x = (x + variance / x) / 2
 
-    return x
-
-
-def format_mode(modes):
+def stream_window_results(filename, title, rows):
     """
-    Format mode list for display.
+    Print and save rolling statistics as each window is produced.
 
     Args:
-        modes (list): List of mode values
+        filename (str): Output filename
+        title (str): Description of the windowing mode
+        rows (iterable): Stream of formatted window lines
 
     Returns:
-        str: Formatted mode string
+        int: Number of windows written
     """
-    if not modes:
-        return "No mode (all values appear once)"
-    if len(modes) == 1:
-        return f"{modes[0]}"
-    return f"Multiple modes: {', '.join(map(str, modes))}"
+    windows = 0
+    try:
+        with open(filename, "w", encoding="utf-8") as file:
+            for text in ("=" * 50, "ROLLING STATISTICS RESULTS", title, "=" * 50):
+                print(text)
+                file.write(text + "\n")
+            for row in rows:
+                windows += 1
+                print(row)
+                file.write(row + "\n")
+            file.write(f"\nTotal windows: {windows}\n")
+        print(f"\nTotal windows: {windows}")
+        print(f"Results saved to '{filename}'")
+    except (IOError, OSError) as e:
+        print(f"Error saving results: {e}")
+    return windows
 
 
 def save_results(filename, results, elapsed_time):
@@ -241,23 +244,227 @@ def display_results(results, elapsed_time):
     print("=" * 50)
 
 
+def format_binned_report(summary, edges, counts, scale, elapsed_time):
+    """
+    Format the binned mode results as a report string.
+
+    Args:
+        summary (dict): Result of summarize_stream
+        edges (list): Bin edges
+        counts (list): Count of values in each bin
+        scale (str): "fixed", "quantile" or "log"
+        elapsed_time (float): Execution time in seconds
+
+    Returns:
+        str: Formatted report
+    """
+    modal_index, mode_estimate = estimate_binned_mode(edges, counts, scale)
+    variance = summary["variance"]
+    lines = [
+        "=" * 50,
+        "BINNED STATISTICS RESULTS",
+        "=" * 50,
+        f"Count of numbers: {summary['count']}",
+        f"Minimum: {summary['minimum']:.6f}",
+        f"Maximum: {summary['maximum']:.6f}",
+        f"Mean: {summary['mean']:.6f}",
+        f"Variance: {variance:.6f}",
+        f"Standard Deviation: {calculate_std_deviation(variance):.6f}",
+        f"Binning: {scale} ({len(counts)} bins)",
+        f"Modal bin: {format_bin_label(edges, modal_index)}"
+        f" with {counts[modal_index]} values",
+        f"Mode (estimated): {mode_estimate:.6f}",
+        "",
+        "HISTOGRAM:",
+        format_histogram(edges, counts, modal_index),
+        "",
+        f"Execution Time: {elapsed_time:.6f} seconds",
+        "=" * 50,
+    ]
+    return "\n".join(lines)
+
+
+def run_binned(args, output_filename):
+    """
+    Execute the binned mode, estimating the mode from a histogram.
+
+    The input file is streamed twice (summary pass, then counting pass),
+    so memory stays fixed no matter how many values the file holds.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        output_filename (str): Output filename
+    """
+    start_time = time.time()
+
+    print(f"Reading data from '{args.filename}'...")
+
+    # Non-finite values cannot be placed in a bin; only quantile bins
+    # need the reservoir sample
+    summary = summarize_stream(
+        stream_numbers(args.filename, parse_finite_number),
+        QUANTILE_SAMPLE_SIZE if args.binning == "quantile" else 0,
+    )
+    if summary["count"] == 0:
+        print("Error: No valid numbers found in the file.")
+        sys.exit(1)
+
+    print(f"Successfully read {summary['count']} numbers.")
+
+    try:
+        edges = compute_bin_edges(summary, args.bins, args.binning)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    counts = build_histogram(
+        stream_numbers(args.filename, parse_finite_number, report=False),
+        edges,
+        args.binning,
+    )
+
+    elapsed_time = time.time() - start_time
+    report = format_binned_report(summary, edges, counts, args.binning, elapsed_time)
+
+    print("\n" + report)
+    try:
+        with open(output_filename, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+        print(f"\nResults saved to '{output_filename}'")
+    except (IOError, OSError) as e:
+        print(f"Error saving results: {e}")
+
+
+def parse_arguments(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="computeStatistics.py",
+        description="Compute descriptive statistics from a file of numbers.",
+    )
+    parser.add_argument("filename", help="file with one number per line")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--window",
+        type=int,
+        metavar="N",
+        help="report rolling statistics over the last N values",
+    )
+    mode.add_argument(
+        "--bucket",
+        type=float,
+        metavar="SECONDS",
+        help="report statistics per time bucket "
+        "(input lines are '<timestamp> <value>')",
+    )
+    mode.add_argument(
+        "--bins",
+        type=int,
+        metavar="N",
+        help="estimate the mode from an N-bin histogram (fixed memory)",
+    )
+    parser.add_argument(
+        "--binning",
+        choices=BINNING_SCALES,
+        default="fixed",
+        help="bin layout used with --bins (default: fixed)",
+    )
+    args = parser.parse_args(argv)
+    if args.window is not None and args.window < 1:
+        parser.error("--window must be at least 1")
+    if args.bucket is not None and args.bucket <= 0:
+        parser.error("--bucket must be greater than 0")
+    if args.bins is not None and args.bins < 1:
+        parser.error("--bins must be at least 1")
+    return args
+
+
+def report_late_sample(timestamp, value):
+    """
+    Print a warning for a sample that arrived after its bucket closed.
+
+    Args:
+        timestamp (float): Timestamp of the sample
+        value (float): Value of the sample
+    """
+    print(
+        f"Warning: Sample {value:g} at timestamp {timestamp:g} belongs to an "
+        "already reported bucket - Skipping"
+    )
+
+
+def run_windowed(args, output_filename):
+    """
+    Execute one of the rolling statistics modes, streaming each window.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        output_filename (str): Output filename
+    """
+    start_time = time.time()
+
+    print(f"Reading data from '{args.filename}'...")
+
+    if args.window is not None:
+        title = f"Sliding window of {args.window} values"
+        rows = (
+            format_window_row(f"Values {first}-{last}", stats)
+            for first, last, stats in iter_sliding_windows(
+                stream_numbers(args.filename, parse_finite_number), args.window
+            )
+        )
+    else:
+        title = f"Time buckets of {args.bucket:g} seconds"
+        rows = (
+            format_window_row(f"Bucket [{start:g}, {end:g})", stats)
+            for start, end, stats in iter_time_buckets(
+                stream_numbers(args.filename, parse_timestamped_line),
+                args.bucket,
+                report_late_sample,
+            )
+        )
+
+    # Produce the first window before touching the output file, so a
+    # missing, unreadable or empty input leaves earlier results intact
+    first_row = next(rows, None)
+    if first_row is None:
+        print("Error: No valid numbers found in the file.")
+        sys.exit(1)
+
+    stream_window_results(output_filename, title, itertools.chain([first_row], rows))
+
+    elapsed_time = time.time() - start_time
+    print(f"Execution Time: {elapsed_time:.6f} seconds")
+
+
 def main():
     """Main function to execute the statistics computation."""
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python computeStatistics.py <filename>")
-        sys.exit(1)
+    args = parse_arguments(sys.argv[1:])
 
-    input_filename = sys.argv[1]
+    input_filename = args.filename
     output_filename = "StatisticsResults.txt"
 
+    if args.window is not None or args.bucket is not None:
+        run_windowed(args, output_filename)
+        return
+    if args.bins is not None:
+        run_binned(args, output_filename)
+        return
+
     # Start timing
     start_time = time.time()
 
     print(f"Reading data from '{input_filename}'...")
 
     # Read numbers from file
-    numbers = read_numbers_from_file(input_filename)
+    numbers = list(stream_numbers(input_filename))
 
     if not numbers:
         print("Error: No valid numbers found in the file.")
@@ -266,26 +473,13 @@ def main():
     print(f"Successfully read {len(numbers)} numbers.")
 
     # Calculate statistics
-    mean = calculate_mean(numbers)
-    median = calculate_median(numbers)
-    modes = calculate_mode(numbers)
-    variance = calculate_variance(numbers, mean)
-    std_dev = calculate_std_deviation(variance)
+    results = compute_statistics(numbers)
+    results["mode"] = format_mode(results["modes"])
 
     # End timing
     end_time = time.time()
     elapsed_time = end_time - start_time
 
-    # Prepare results
-    results = {
-        "count": len(numbers),
-        "mean": mean,
-        "median": median,
-        "mode": format_mode(modes),
-        "variance": variance,
-        "std_dev": std_dev,
-    }
-
     # Display and save results
     display_results(results, elapsed_time)
     save_results(output_filename, results, elapsed_time)
@@ -0,0 +1,688 @@
+"""
+Descriptive Statistics Library
+
+Side-effect-free statistics routines used by computeStatistics.py: reading
+numbers from plain or compressed files, whole-file statistics computed with
+manual algorithms, rolling window statistics and histogram-based mode
+estimation. Nothing here prints or exits; readers raise on I/O errors and
+report skipped lines through an optional sink.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import bisect
+import heapq
+import math
+import random
+from collections import deque
+
+from compressed_input import open_text_input
+
+# Number of values kept by the reservoir sketch used for quantile bins
+QUANTILE_SAMPLE_SIZE = 10000
+BINNING_SCALES = ("fixed", "quantile", "log")
+
+
+def parse_finite_number(line):
+    """
+    Parse a line holding one finite number.
+
+    float() also accepts "nan" and "inf" (and overflows such as "1e400"
+    to inf). The rolling and binned modes cannot place such values, so
+    they read lines with this parser and skip them as invalid.
+
+    Args:
+        line (str): Stripped line of text
+
+    Returns:
+        float: Parsed value
+
+    Raises:
+        ValueError: If the line is not a finite number
+    """
+    value = float(line)
+    if not math.isfinite(value):
+        raise ValueError(f"non-finite value '{line}'")
+    return value
+
+
+def parse_timestamped_line(line):
+    """
+    Parse a "<timestamp> <value>" line used by the time-bucketed mode.
+
+    Args:
+        line (str): Stripped line of text
+
+    Returns:
+        tuple: (timestamp, value) as floats
+
+    Raises:
+        ValueError: If the line does not hold exactly two finite numbers
+    """
+    fields = line.split()
+    if len(fields) != 2:
+        raise ValueError(f"expected '<timestamp> <value>', got '{line}'")
+    return parse_finite_number(fields[0]), parse_finite_number(fields[1])
+
+
+def iter_numbers_from_file(filename, parse=float, on_invalid=None):
+    """
+    Lazily read numbers from a file, yielding each valid entry.
+
+    Streaming lets the windowed and binned modes handle large files
+    without holding every value in memory.
+
+    Args:
+        filename (str): Path to the file containing numbers
+        parse (callable): Converts a stripped line into a value
+        on_invalid (callable): Optional sink called as
+            on_invalid(line_number, line) for each skipped line
+
+    Yields:
+        Parsed value for each valid line
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    with open_text_input(filename) as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if line:  # Skip empty lines
+                try:
+                    value = parse(line)
+                except ValueError:
+                    if on_invalid is not None:
+                        on_invalid(line_number, line)
+                    continue
+                yield value
+
+
+def read_numbers_from_file(filename, on_invalid=None):
+    """
+    Read numbers from a file and return a list of valid numbers.
+
+    Args:
+        filename (str): Path to the file containing numbers
+        on_invalid (callable): Optional sink called as
+            on_invalid(line_number, line) for each skipped line
+
+    Returns:
+        list: List of valid numbers (float)
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    return list(iter_numbers_from_file(filename, on_invalid=on_invalid))
+
+
+def calculate_mean(numbers):
+    """
+    Calculate the arithmetic mean of a list of numbers.
+
+    Args:
+        numbers (list): List of numbers
+
+    Returns:
+        float: Mean value
+    """
+    if not numbers:
+        return 0.0
+    return sum(numbers) / len(numbers)
+
+
+def calculate_median(numbers):
+    """
+    Calculate the median of a list of numbers.
+
+    Args:
+        numbers (list): List of numbers
+
+    Returns:
+        float: Median value
+    """
+    if not numbers:
+        return 0.0
+
+    sorted_numbers = sorted(numbers)
+    n = len(sorted_numbers)
+
+    if n % 2 == 0:
+        # Even number of elements: average of two middle values
+        median = (sorted_numbers[n // 2 - 1] + sorted_numbers[n // 2]) / 2
+    else:
+        # Odd number of elements: middle value
+        median = sorted_numbers[n // 2]
+
+    return median
+
+
+def calculate_mode(numbers):
+    """
+    Calculate the mode(s) of a list of numbers.
+
+    Args:
+        numbers (list): List of numbers
+
+    Returns:
+        list: List of mode values (can be multiple if multimodal)
+    """
+    if not numbers:
+        return []
+
+    # Count frequency of each number
+    frequency = {}
+    for num in numbers:
+        frequency[num] = frequency.get(num, 0) + 1
+
+    # Find maximum frequency
+    max_frequency = max(frequency.values())
+
+    # Find all numbers with maximum frequency
+    modes = [num for num, freq in frequency.items() if freq == max_frequency]
+
+    # If all numbers appear once, there is no mode
+    if max_frequency == 1:
+        return []
+
+    return sorted(modes)
+
+
+def calculate_variance(numbers, mean):
+    """
+    Calculate the variance of a list of numbers.
+
+    Args:
+        numbers (list): List of numbers
+        mean (float): Mean of the numbers
+
+    Returns:
+        float: Variance value
+    """
+    if len(numbers) < 2:
+        return 0.0
+
+    # Sum of squared differences from mean
+    squared_diffs = sum((x - mean) ** 2 for x in numbers)
+
+    # Population variance (dividing by n)
+    variance = squared_diffs / len(numbers)
+
+    return variance
+
+
+def calculate_std_deviation(variance):
+    """
+    Calculate the standard deviation from variance.
+
+    Args:
+        variance (float): Variance value
+
+    Returns:
+        float: Standard deviation value
+    """
+    # Manual square root calculation using Newton's method
+    if variance == 0:
+        return 0.0
+
+    # Initial guess
+    x = variance
+    # Newton's method for square root
+    for _ in range(50):  # Sufficient iterations for convergence
+        x = (x + variance / x) / 2
+
+    return x
+
+
+def compute_statistics(numbers):
+    """
+    Compute every descriptive statistic of a list of numbers.
+
+    Args:
+        numbers (list): List of numbers
+
+    Returns:
+        dict: count, mean, median, modes (list), variance and std_dev
+    """
+    mean = calculate_mean(numbers)
+    variance = calculate_variance(numbers, mean)
+    return {
+        "count": len(numbers),
+        "mean": mean,
+        "median": calculate_median(numbers),
+        "modes": calculate_mode(numbers),
+        "variance": variance,
+        "std_dev": calculate_std_deviation(variance),
+    }
+
+
+def summarize_stream(numbers, sample_size=QUANTILE_SAMPLE_SIZE):
+    """
+    First pass for the binned mode: range, moments and a fixed-size sample.
+
+    Memory use is bounded by sample_size regardless of the input length,
+    so the pass works on files far larger than RAM.
+
+    Args:
+        numbers (iterable): Stream of finite numbers
+        sample_size (int): Maximum number of values kept in the sample
+            (only quantile bins use it; 0 skips sampling)
+
+    Returns:
+        dict: count, minimum, maximum, mean, variance and a reservoir
+              sample of the values
+    """
+    # Fixed seed keeps quantile bin edges reproducible between runs
+    generator = random.Random(0)
+    sample = []
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    minimum = maximum = 0.0
+
+    for number in numbers:
+        count += 1
+        if count == 1:
+            minimum = maximum = number
+        elif number < minimum:
+            minimum = number
+        elif number > maximum:
+            maximum = number
+
+        delta = number - mean
+        mean += delta / count
+        m2 += delta * (number - mean)
+
+        # Reservoir sampling (Algorithm R)
+        if len(sample) < sample_size:
+            sample.append(number)
+        elif sample_size:
+            slot = generator.randrange(count)
+            if slot < sample_size:
+                sample[slot] = number
+
+    return {
+        "count": count,
+        "minimum": minimum,
+        "maximum": maximum,
+        "mean": mean,
+        "variance": max(m2 / count, 0.0) if count > 1 else 0.0,
+        "sample": sample,
+    }
+
+
+def compute_bin_edges(summary, bins, scale):
+    """
+    Compute histogram bin edges from a first-pass summary.
+
+    Args:
+        summary (dict): Result of summarize_stream
+        bins (int): Requested number of bins
+        scale (str): "fixed", "quantile" or "log"
+
+    Returns:
+        list: Increasing bin edges (number of bins + 1 values)
+
+    Raises:
+        ValueError: If log bins are requested for non-positive data
+    """
+    low = summary["minimum"]
+    high = summary["maximum"]
+    if low == high:
+        return [low, high]
+
+    if scale == "log":
+        if low <= 0:
+            raise ValueError("log-scale bins require all values to be positive")
+        log_low = math.log(low)
+        step = (math.log(high) - log_low) / bins
+        edges = [math.exp(log_low + step * index) for index in range(bins + 1)]
+    elif scale == "quantile":
+        sample = sorted(summary["sample"])
+        last = len(sample) - 1
+        edges = [sample[(last * index) // bins] for index in range(bins + 1)]
+    else:
+        width = (high - low) / bins
+        edges = [low + width * index for index in range(bins + 1)]
+
+    # Exact extremes avoid rounding drift and sample misses at both ends
+    edges[0] = low
+    edges[-1] = high
+
+    # Repeated quantiles collapse into a single bin
+    unique_edges = [edges[0]]
+    for edge in edges[1:]:
+        if edge > unique_edges[-1]:
+            unique_edges.append(edge)
+    return unique_edges
+
+
+def build_histogram(numbers, edges, scale):
+    """
+    Second pass for the binned mode: count values per bin.
+
+    Fixed and log bins are located arithmetically in O(1); quantile bins
+    use a binary search over the edges.
+
+    Args:
+        numbers (iterable): Stream of finite numbers
+        edges (list): Bin edges from compute_bin_edges
+        scale (str): "fixed", "quantile" or "log"
+
+    Returns:
+        list: Count of values in each bin
+    """
+    bins = len(edges) - 1
+    counts = [0] * bins
+    last = bins - 1
+    low = edges[0]
+    high = edges[-1]
+
+    if low == high:
+        counts[0] = sum(1 for _ in numbers)
+        return counts
+
+    if scale == "log":
+        origin = math.log(low)
+        factor = bins / (math.log(high) - origin)
+    else:
+        origin = low
+        factor = bins / (high - low)
+
+    for number in numbers:
+        if scale == "quantile":
+            index = bisect.bisect_right(edges, number) - 1
+        elif scale == "log":
+            index = int((math.log(number) - origin) * factor)
+        else:
+            index = int((number - origin) * factor)
+        counts[min(max(index, 0), last)] += 1
+
+    return counts
+
+
+def estimate_binned_mode(edges, counts, scale):
+    """
+    Estimate the mode as the centre of the densest bin.
+
+    Fixed and log bins have equal widths on their own scale, so the
+    densest bin is the one with the highest count. Quantile bins have
+    roughly equal counts, so their density is count divided by width.
+
+    Args:
+        edges (list): Bin edges
+        counts (list): Count of values in each bin
+        scale (str): "fixed", "quantile" or "log"
+
+    Returns:
+        tuple: (bin_index, mode_estimate)
+    """
+    best_index = 0
+    best_density = -1.0
+    for index, count in enumerate(counts):
+        density = count
+        width = edges[index + 1] - edges[index]
+        if scale == "quantile" and width > 0:
+            density = count / width
+        if density > best_density:
+            best_index = index
+            best_density = density
+
+    low = edges[best_index]
+    high = edges[best_index + 1]
+    if scale == "log":
+        return best_index, math.sqrt(low * high)
+    return best_index, (low + high) / 2
+
+
+class RollingStatistics:  # pylint: disable=too-many-instance-attributes
+    """
+    Incrementally maintained statistics for a changing window of values.
+
+    Mean and variance are updated with Welford's recurrence (O(1) per
+    add/remove) and the median with two heaps plus lazy deletion
+    (O(log w) per add/remove), so sliding a window over n values costs
+    O(n log w) instead of recomputing every statistic per window.
+
+    Welford's downdate (remove) accumulates rounding error that never
+    decays, which shows after large values leave the window, and removed
+    values can stay buried in the heaps, so callers that hold the window
+    call resync() every w removals to keep both bounded.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        # Max-heap (stored negated) holding the lower half of the values
+        self._low = []
+        # Min-heap holding the upper half of the values
+        self._high = []
+        # Live sizes of each half (heaps may hold stale entries)
+        self._low_size = 0
+        self._high_size = 0
+        # Values removed from the window but still buried in a heap
+        self._delayed = {}
+
+    def add(self, value):
+        """
+        Add a value to the window.
+
+        Args:
+            value (float): Value entering the window
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if not self._low or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value):
+        """
+        Remove a value that was previously added to the window.
+
+        Args:
+            value (float): Value leaving the window
+        """
+        self.count -= 1
+        if self.count == 0:
+            self.mean = 0.0
+            self._m2 = 0.0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self._m2 -= delta * (value - self.mean)
+
+        self._delayed[value] = self._delayed.get(value, 0) + 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            if value == self._high[0]:
+                self._prune(self._high, 1)
+        self._rebalance()
+
+    def resync(self, values):
+        """
+        Recompute the window's state exactly from its values.
+
+        The mean and variance are recomputed to cancel downdate drift. The
+        heaps are rebuilt once removed values outnumber live ones: lazy
+        deletion only pops a removed value when it reaches a heap top, so
+        on monotonic input they pile up at the bottom of a heap and would
+        otherwise grow with the whole stream.
+
+        Args:
+            values (collections.abc.Collection): Values currently in the
+                window
+        """
+        self.mean = calculate_mean(values)
+        self._m2 = calculate_variance(values, self.mean) * len(values)
+
+        if len(self._low) + len(self._high) > 2 * self.count:
+            ordered = sorted(values)
+            split = (len(ordered) + 1) // 2
+            # Sorted lists are valid heaps; the lower half is stored negated
+            self._low = [-value for value in reversed(ordered[:split])]
+            self._high = ordered[split:]
+            self._low_size = split
+            self._high_size = len(ordered) - split
+            self._delayed = {}
+
+    def median(self):
+        """
+        Return the median of the values currently in the window.
+
+        Returns:
+            float: Median value
+        """
+        if self.count == 0:
+            return 0.0
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def variance(self):
+        """
+        Return the population variance of the values in the window.
+
+        Returns:
+            float: Variance value
+        """
+        if self.count < 2:
+            return 0.0
+        # Guard against tiny negative values from floating-point cancellation
+        return max(self._m2 / self.count, 0.0)
+
+    def snapshot(self):
+        """
+        Return the current window statistics as a results dictionary.
+
+        Returns:
+            dict: count, mean, median, variance and std_dev of the window
+        """
+        variance = self.variance()
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "median": self.median(),
+            "variance": variance,
+            "std_dev": calculate_std_deviation(variance),
+        }
+
+    def _prune(self, heap, sign):
+        """Pop entries from the top of a heap that are pending removal."""
+        while heap:
+            value = sign * heap[0]
+            pending = self._delayed.get(value, 0)
+            if pending == 0:
+                break
+            if pending == 1:
+                del self._delayed[value]
+            else:
+                self._delayed[value] = pending - 1
+            heapq.heappop(heap)
+
+    def _rebalance(self):
+        """Keep the lower half equal to, or one larger than, the upper half."""
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, 1)
+
+
+def iter_sliding_windows(numbers, window_size):
+    """
+    Compute statistics over every window of the last N values.
+
+    A result is produced each time a new value arrives once the window is
+    full. Inputs shorter than the window produce a single partial window.
+
+    Args:
+        numbers (iterable): Stream of finite numbers (a NaN could never be
+            matched when it leaves the window)
+        window_size (int): Number of values per window
+
+    Yields:
+        tuple: (first_index, last_index, stats) with 1-based positions
+    """
+    rolling = RollingStatistics()
+    window = deque()
+    position = 0
+    removals = 0
+
+    for position, number in enumerate(numbers, 1):
+        window.append(number)
+        rolling.add(number)
+        if len(window) > window_size:
+            rolling.remove(window.popleft())
+            removals += 1
+            # Rebuild the state once per window to cancel downdate drift and
+            # drop stale heap entries; O(w log w) every w removals keeps the
+            # amortized cost O(log w)
+            if removals == window_size:
+                rolling.resync(window)
+                removals = 0
+        if len(window) == window_size:
+            yield position - window_size + 1, position, rolling.snapshot()
+
+    if 0 < position < window_size:
+        yield 1, position, rolling.snapshot()
+
+
+def iter_time_buckets(samples, bucket_size, on_late=None):
+    """
+    Compute statistics for consecutive fixed-width time buckets.
+
+    Samples are expected in time order; a bucket is closed and reported
+    as soon as a sample falls into a later bucket. A sample whose
+    timestamp falls into an earlier, already reported bucket is skipped
+    rather than reopening that bucket as a duplicate row.
+
+    Args:
+        samples (iterable): Stream of (timestamp, value) tuples of finite
+            numbers
+        bucket_size (float): Bucket width in timestamp units
+        on_late (callable): Optional sink called as
+            on_late(timestamp, value) for each skipped sample
+
+    Yields:
+        tuple: (bucket_start, bucket_end, stats)
+    """
+    rolling = RollingStatistics()
+    current_bucket = None
+
+    for timestamp, value in samples:
+        bucket = timestamp // bucket_size * bucket_size
+        if current_bucket is not None and bucket < current_bucket:
+            if on_late is not None:
+                on_late(timestamp, value)
+            continue
+        if bucket != current_bucket:
+            if current_bucket is not None:
+                yield (
+                    current_bucket,
+                    current_bucket + bucket_size,
+                    rolling.snapshot(),
+                )
+                rolling = RollingStatistics()
+            current_bucket = bucket
+        rolling.add(value)
+
+    if current_bucket is not None:
+        yield current_bucket, current_bucket + bucket_size, rolling.snapshot()
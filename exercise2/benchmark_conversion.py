@@ -0,0 +1,159 @@
+"""
+Conversion Round-Trip Benchmark
+
+Measures the throughput of conversion_core in both directions: random
+integers are written in each base with BaseConverter, parsed back with
+BaseParser (in memory and through read_encoded_numbers_from_file), and
+checked against the originals.
+
+Usage: python benchmark_conversion.py [--count N] [--bits B] [--bases LIST]
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from conversion_core import (
+    BaseConverter,
+    BaseParser,
+    parse_base_list,
+    read_encoded_numbers_from_file,
+)
+
+
+def measure(function, *args):
+    """
+    Run a function once and time it.
+
+    Args:
+        function (callable): Function to run
+        *args: Arguments for the function
+
+    Returns:
+        tuple: (result, elapsed seconds)
+    """
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+def write_lines(texts):
+    """
+    Write digit strings to a temporary file, one per line.
+
+    Args:
+        texts (list): Digit strings
+
+    Returns:
+        str: Path of the file (the caller removes it)
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".txt", delete=False
+    ) as file:
+        for text in texts:
+            file.write(text + "\n")
+    return file.name
+
+
+def benchmark_base(base, numbers):
+    """
+    Round-trip a list of numbers through one base.
+
+    Args:
+        base (str): Name of the base (key of BASES)
+        numbers (list): Integers to convert
+
+    Returns:
+        tuple: (encode seconds, parse seconds, file read seconds)
+
+    Raises:
+        RuntimeError: If a parsed value differs from the original
+    """
+    converter = BaseConverter((base,))
+    parser = BaseParser(base)
+
+    texts, encode_time = measure(
+        lambda: [converter.convert(number)[0] for number in numbers]
+    )
+    (parsed, invalid), parse_time = measure(parser.parse_batch, texts)
+    if invalid or [value for _, value in parsed] != numbers:
+        raise RuntimeError(f"{base} round trip changed the values in memory")
+
+    path = write_lines(texts)
+    try:
+        from_file, read_time = measure(read_encoded_numbers_from_file, path, base)
+    finally:
+        os.remove(path)
+    if [value for _, value in from_file] != numbers:
+        raise RuntimeError(f"{base} round trip changed the values read from file")
+
+    return encode_time, parse_time, read_time
+
+
+def parse_arguments(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="benchmark_conversion.py",
+        description="Measure conversion round-trip throughput.",
+    )
+    parser.add_argument(
+        "--count", type=int, default=200000, help="numbers per base (default: 200000)"
+    )
+    parser.add_argument(
+        "--bits",
+        type=int,
+        default=64,
+        help="magnitude of the random numbers in bits (default: 64)",
+    )
+    parser.add_argument(
+        "--bases",
+        default="binary,octal,hexadecimal",
+        metavar="LIST",
+        help="comma-separated bases to measure (default: binary,octal,hexadecimal)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        if args.count < 1 or args.bits < 1:
+            raise ValueError("--count and --bits must be at least 1")
+        args.bases = parse_base_list(args.bases)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main():
+    """Run the benchmark and print numbers per second for each base."""
+    args = parse_arguments(sys.argv[1:])
+
+    generator = random.Random(0)
+    limit = 1 << args.bits
+    numbers = [generator.randrange(-limit, limit) for _ in range(args.count)]
+
+    print(f"Round trip of {args.count} random {args.bits}-bit numbers (numbers/s)")
+    print(f"{'Base':<12} {'Encode':>12} {'Parse':>12} {'File read':>12}")
+    for base in args.bases:
+        try:
+            timings = benchmark_base(base, numbers)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        rates = "".join(f" {args.count / elapsed:>12,.0f}" for elapsed in timings)
+        print(f"{base:<12}{rates}")
+
+
+if __name__ == "__main__":
+    main()
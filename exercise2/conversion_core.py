@@ -0,0 +1,540 @@
+"""
+Number Conversion Library
+
+Side-effect-free conversion routines used by convertNumbers.py: reading
+numbers from plain or compressed files, converting them to binary,
+octal, hexadecimal, base-32 and base-36 with manual algorithms, and
+parsing such digit strings back into integers. Nothing here prints or
+exits; readers raise on I/O errors and report skipped
+lines through an optional sink.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import functools
+import itertools
+
+from compressed_input import open_text_input
+
+# Digit symbols shared by every supported base (base-36 uses all of them)
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Supported output bases and their radix, in table column order
+BASES = {
+    "binary": 2,
+    "octal": 8,
+    "hexadecimal": 16,
+    "base32": 32,
+    "base36": 36,
+}
+DEFAULT_BASES = ("binary", "hexadecimal")
+# Upper bound on the entries of one precomputed chunk table
+CHUNK_TABLE_SIZE = 4096
+# Bits per chunk of the shared decomposition: a whole number of binary,
+# octal and hexadecimal digits, and one chunk table entry
+CHUNK_BITS = 12
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+# Optional prefixes accepted (case-insensitively) when parsing digit strings
+BASE_PREFIXES = {"binary": "0B", "octal": "0O", "hexadecimal": "0X"}
+# Lines validated and parsed together by the reverse reader
+PARSE_BATCH_LINES = 4096
+
+
+def read_numbers_from_file(filename, on_invalid=None):
+    """
+    Read numbers from a file and return a list of valid integers.
+
+    Args:
+        filename (str): Path to the file containing numbers
+        on_invalid (callable): Optional sink called as
+            on_invalid(line_number, line) for each skipped line
+
+    Returns:
+        list: List of valid integers
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    numbers = []
+
+    with open_text_input(filename) as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if line:  # Skip empty lines
+                try:
+                    # Convert to float first, then to int to handle decimals
+                    number = int(float(line))
+                    numbers.append(number)
+                except (ValueError, OverflowError):
+                    # "1e400" parses to inf, which has no integer value
+                    if on_invalid is not None:
+                        on_invalid(line_number, line)
+
+    return numbers
+
+
+class BaseConverter:
+    """
+    Convert integers to several bases from one decomposition per number.
+
+    The magnitude of each number is split once into CHUNK_BITS-bit chunks
+    with shifts and masks. Binary, octal and hexadecimal digits divide
+    that chunk size evenly, so each of them is written by looking every
+    chunk up in a precomputed table of digit strings; requesting another
+    of these bases costs one table lookup per chunk. Base-32 uses the same
+    kind of table over 10-bit chunks, and base-36 divides by a chunk of
+    two digits at a time.
+
+    Without a width, negative numbers are written as "-" plus the
+    magnitude. With a width, numbers are written as fixed-width two's
+    complement bit patterns, padded with zeros to the digits that width
+    needs in each base.
+    """
+
+    def __init__(self, bases=DEFAULT_BASES, width=None):
+        """
+        Build the digit tables for the requested bases.
+
+        Args:
+            bases (tuple): Names of the output bases (keys of BASES)
+            width (int): Two's complement width in bits (None for signed
+                magnitude output)
+
+        Raises:
+            ValueError: If a base is unknown or the width is not positive
+        """
+        for base in bases:
+            if base not in BASES:
+                raise ValueError(f"Unknown base '{base}'")
+        if width is not None and width < 1:
+            raise ValueError("Width must be at least 1 bit")
+
+        self.bases = tuple(bases)
+        self.width = width
+        self._plans = [self._plan(BASES[base]) for base in self.bases]
+
+    def _plan(self, radix):
+        """
+        Precompute how one base is rendered.
+
+        Args:
+            radix (int): Base of the output
+
+        Returns:
+            tuple: (chunk table, chunk bits (0 unless radix is a power of
+                    two), chunk value, fixed digit count or 0)
+        """
+        digits = 1
+        while radix ** (digits + 1) <= CHUNK_TABLE_SIZE:
+            digits += 1
+        table = build_chunk_table(radix, digits)
+
+        chunk_bits = 0
+        if radix & (radix - 1) == 0:
+            chunk_bits = digits * (radix.bit_length() - 1)
+
+        pad = 0
+        if self.width is not None:
+            largest = (1 << self.width) - 1
+            while largest > 0:
+                largest //= radix
+                pad += 1
+        return table, chunk_bits, radix**digits, pad
+
+    def decompose(self, number):
+        """
+        Split a number into the chunks shared by the power-of-two bases.
+
+        Args:
+            number (int): Decimal number
+
+        Returns:
+            tuple: (sign prefix, magnitude, CHUNK_BITS-bit chunks most
+                    significant first)
+
+        Raises:
+            ValueError: If the number does not fit in the fixed width
+        """
+        sign = ""
+        if self.width is None:
+            magnitude = number
+            if number < 0:
+                sign = "-"
+                magnitude = -number
+        else:
+            limit = 1 << (self.width - 1)
+            if number < -limit or number >= limit:
+                raise ValueError(
+                    f"{number} does not fit in {self.width}-bit two's complement"
+                )
+            magnitude = number + 2 * limit if number < 0 else number
+
+        chunks = []
+        remaining = magnitude
+        while True:
+            chunks.append(remaining & CHUNK_MASK)
+            remaining >>= CHUNK_BITS
+            if remaining == 0:
+                break
+        chunks.reverse()
+        return sign, magnitude, chunks
+
+    def convert(self, number):
+        """
+        Convert one number to every requested base.
+
+        Args:
+            number (int): Decimal number to convert
+
+        Returns:
+            tuple: Representation in each base, in the order requested
+
+        Raises:
+            ValueError: If the number does not fit in the fixed width
+        """
+        sign, magnitude, chunks = self.decompose(number)
+
+        results = []
+        for table, chunk_bits, chunk_value, pad in self._plans:
+            if chunk_bits == CHUNK_BITS:
+                parts = [table[chunk] for chunk in chunks]
+            elif chunk_bits:
+                parts = split_by_shift(magnitude, table, chunk_bits)
+            else:
+                parts = split_by_division(magnitude, table, chunk_value)
+
+            digits = "".join(parts).lstrip("0") or "0"
+            if pad > len(digits):
+                digits = "0" * (pad - len(digits)) + digits
+            results.append(sign + digits)
+
+        return tuple(results)
+
+
+def split_by_shift(magnitude, table, chunk_bits):
+    """
+    Cut a number into the digit chunks of a power-of-two base.
+
+    Args:
+        magnitude (int): Non-negative value to write
+        table (tuple): Digit strings of every chunk value
+        chunk_bits (int): Bits per chunk
+
+    Returns:
+        list: Digit chunks, most significant first
+    """
+    mask = (1 << chunk_bits) - 1
+    parts = []
+    while magnitude > 0:
+        parts.append(table[magnitude & mask])
+        magnitude >>= chunk_bits
+    parts.reverse()
+    return parts
+
+
+def split_by_division(magnitude, table, chunk_value):
+    """
+    Peel the digit chunks of any base off a number, several digits at once.
+
+    Args:
+        magnitude (int): Non-negative value to write
+        table (tuple): Digit strings of every chunk value
+        chunk_value (int): Radix raised to the digits per chunk
+
+    Returns:
+        list: Digit chunks, most significant first
+    """
+    parts = []
+    while magnitude > 0:
+        magnitude, chunk = divmod(magnitude, chunk_value)
+        parts.append(table[chunk])
+    parts.reverse()
+    return parts
+
+
+@functools.lru_cache(maxsize=None)
+def build_chunk_table(radix, digits):
+    """
+    Precompute the digit strings of every chunk value.
+
+    Args:
+        radix (int): Base of the digits
+        digits (int): Digits per chunk
+
+    Returns:
+        tuple: Entry v is v written with exactly `digits` digits
+    """
+    table = [""]
+    for _ in range(digits):
+        table = [prefix + DIGITS[digit] for prefix in table for digit in range(radix)]
+    return tuple(table)
+
+
+def parse_base_list(text):
+    """
+    Parse a comma-separated list of base names, such as "binary,octal".
+
+    Args:
+        text (str): Base names separated by commas (case-insensitive)
+
+    Returns:
+        tuple: Names of the bases (keys of BASES), in the given order
+
+    Raises:
+        ValueError: If a name is not a supported base
+    """
+    bases = tuple(base.strip().lower() for base in text.split(","))
+    for base in bases:
+        if base not in BASES:
+            raise ValueError(f"Unknown base '{base}' (choose from {', '.join(BASES)})")
+    return bases
+
+
+@functools.lru_cache(maxsize=None)
+def get_converter(bases=DEFAULT_BASES, width=None):
+    """
+    Return a shared converter for a combination of bases and width.
+
+    Args:
+        bases (tuple): Names of the output bases (keys of BASES)
+        width (int): Two's complement width in bits (None for signed
+            magnitude output)
+
+    Returns:
+        BaseConverter: Converter with its tables built
+    """
+    return BaseConverter(bases, width)
+
+
+def decimal_to_binary(number):
+    """
+    Convert a decimal number to binary representation.
+
+    Args:
+        number (int): Decimal number to convert
+
+    Returns:
+        str: Binary representation (e.g., "1010" for 10)
+    """
+    return get_converter(("binary",)).convert(number)[0]
+
+
+def decimal_to_hexadecimal(number):
+    """
+    Convert a decimal number to hexadecimal representation.
+
+    Args:
+        number (int): Decimal number to convert
+
+    Returns:
+        str: Hexadecimal representation (e.g., "A" for 10)
+    """
+    return get_converter(("hexadecimal",)).convert(number)[0]
+
+
+def convert_numbers(numbers, bases=DEFAULT_BASES, width=None):
+    """
+    Convert every number to each of the requested bases.
+
+    Args:
+        numbers (list): List of integers
+        bases (tuple): Names of the output bases (keys of BASES)
+        width (int): Two's complement width in bits (None for signed
+            magnitude output)
+
+    Returns:
+        list: List of tuples (decimal, representation in each base)
+
+    Raises:
+        ValueError: If a base is unknown, the width is not positive or a
+            number does not fit in the width
+    """
+    converter = get_converter(tuple(bases), width)
+    conversions = []
+    for number in numbers:
+        conversions.append((number, *converter.convert(number)))
+    return conversions
+
+
+class BaseParser:
+    """
+    Parse digit strings of one base back into integers.
+
+    Digits are consumed a whole chunk at a time: the string is left-padded
+    with zeros to a multiple of the chunk length and every slice is looked
+    up in a precomputed table mapping chunk text to its value, the inverse
+    of the tables BaseConverter writes with. A slice missing from the table
+    means the string holds a character outside the base, so validation
+    comes with the lookup for free.
+
+    Strings may carry a leading "-" or "+" and, for binary, octal and
+    hexadecimal, a 0b/0o/0x prefix; letters are case-insensitive. With a
+    width, strings are read as fixed-width two's complement bit patterns
+    (without a sign), the inverse of BaseConverter with the same width.
+    """
+
+    def __init__(self, base, width=None):
+        """
+        Build the chunk table for the base.
+
+        Args:
+            base (str): Name of the input base (key of BASES)
+            width (int): Two's complement width in bits (None for signed
+                magnitude input)
+
+        Raises:
+            ValueError: If the base is unknown or the width is not positive
+        """
+        if base not in BASES:
+            raise ValueError(f"Unknown base '{base}'")
+        if width is not None and width < 1:
+            raise ValueError("Width must be at least 1 bit")
+
+        self.base = base
+        self.width = width
+        self._prefix = BASE_PREFIXES.get(base, "")
+
+        radix = BASES[base]
+        digits = 1
+        while radix ** (digits + 1) <= CHUNK_TABLE_SIZE:
+            digits += 1
+        self._chunk_digits = digits
+        self._table = build_parse_table(radix, digits)
+        self._chunk_bits = 0
+        if radix & (radix - 1) == 0:
+            self._chunk_bits = digits * (radix.bit_length() - 1)
+        self._chunk_value = radix**digits
+
+    def parse(self, text):
+        """
+        Parse one digit string.
+
+        Args:
+            text (str): Digits, without surrounding whitespace
+
+        Returns:
+            int: Decimal value
+
+        Raises:
+            ValueError: If the string is not a valid number in this base
+                (or does not fit in the fixed width)
+        """
+        digits = text.upper()
+        sign = digits[:1]
+        if sign in ("-", "+"):
+            digits = digits[1:]
+        else:
+            sign = ""
+        if self._prefix and digits.startswith(self._prefix):
+            digits = digits[2:]
+        # A two's complement bit pattern carries no sign of its own
+        if not digits or (sign and self.width is not None):
+            raise ValueError(f"Invalid {self.base} number: '{text}'")
+
+        # Left-pad to whole chunks so every slice is a table key
+        size = self._chunk_digits
+        lead = -len(digits) % size
+        if lead:
+            digits = "0" * lead + digits
+
+        table = self._table
+        bits = self._chunk_bits
+        value = 0
+        try:
+            for start in range(0, len(digits), size):
+                chunk = table[digits[start : start + size]]
+                if bits:
+                    value = (value << bits) | chunk
+                else:
+                    value = value * self._chunk_value + chunk
+        except KeyError:
+            raise ValueError(f"Invalid {self.base} number: '{text}'") from None
+
+        if self.width is not None:
+            if value >> self.width:
+                raise ValueError(f"'{text}' does not fit in {self.width} bits")
+            if value >> (self.width - 1):
+                value -= 1 << self.width
+        return -value if sign == "-" else value
+
+    def parse_batch(self, texts):
+        """
+        Validate and parse a batch of digit strings.
+
+        Invalid strings do not stop the batch; their positions are
+        returned so the caller can report them.
+
+        Args:
+            texts (list): Digit strings, without surrounding whitespace
+
+        Returns:
+            tuple: (list of (text, value) for the valid strings, list of
+                    indexes of the invalid strings)
+        """
+        parsed = []
+        invalid = []
+        parse = self.parse
+        for index, text in enumerate(texts):
+            try:
+                parsed.append((text, parse(text)))
+            except ValueError:
+                invalid.append(index)
+        return parsed, invalid
+
+
+@functools.lru_cache(maxsize=None)
+def build_parse_table(radix, digits):
+    """
+    Precompute the value of every chunk of digits.
+
+    Args:
+        radix (int): Base of the digits
+        digits (int): Digits per chunk
+
+    Returns:
+        dict: Maps each `digits`-long uppercase digit string to its value
+    """
+    return {text: value for value, text in enumerate(build_chunk_table(radix, digits))}
+
+
+def read_encoded_numbers_from_file(filename, base, width=None, on_invalid=None):
+    """
+    Read digit strings of one base from a file and parse them.
+
+    Lines are validated and parsed in batches of PARSE_BATCH_LINES;
+    invalid lines are skipped and reported exactly like
+    read_numbers_from_file.
+
+    Args:
+        filename (str): Path to the file containing one number per line
+        base (str): Name of the input base (key of BASES)
+        width (int): Two's complement width in bits (None for signed
+            magnitude input)
+        on_invalid (callable): Optional sink called as
+            on_invalid(line_number, line) for each skipped line
+
+    Returns:
+        list: List of tuples (digit string, decimal value)
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+        ValueError: If the base is unknown or the width is not positive
+    """
+    parser = BaseParser(base, width)
+    numbers = []
+
+    with open_text_input(filename) as file:
+        lines = enumerate(file, 1)
+        while True:
+            batch = list(itertools.islice(lines, PARSE_BATCH_LINES))
+            if not batch:
+                break
+            stripped = [(number, line.strip()) for number, line in batch]
+            batch = [item for item in stripped if item[1]]  # Skip empty lines
+            parsed, invalid = parser.parse_batch([line for _, line in batch])
+            numbers.extend(parsed)
+            if on_invalid is not None:
+                for index in invalid:
+                    on_invalid(*batch[index])
+
+    return numbers
@@ -1,8 +1,11 @@
 """
 Convert Numbers Program
 
-This program converts decimal numbers to binary and hexadecimal
+This program converts decimal numbers to binary and hexadecimal (and
+optionally octal, base-32, base-36 or fixed-width two's complement)
 representations using manual algorithms (no built-in conversion functions).
+In reverse mode it parses numbers written in one of those bases back to
+decimal.
 
 Author: Alejandro Díaz
 Date: February 2026
@@ -13,188 +16,171 @@ Note: Module name 'convertNumbers' is required by assignment specification
 
 # pylint: disable=invalid-name
 
+import argparse
 import sys
 import time
 
+from conversion_core import (
+    BASES,
+    DEFAULT_BASES,
+    convert_numbers,
+    parse_base_list,
+    read_encoded_numbers_from_file,
+    read_numbers_from_file,
+)
+
+# Column titles of the output bases
+BASE_TITLES = {
+    "binary": "Binary",
+    "octal": "Octal",
+    "hexadecimal": "Hexadecimal",
+    "base32": "Base32",
+    "base36": "Base36",
+}
+# Invalid lines warned about one by one; the rest are only counted
+MAX_INVALID_WARNINGS = 20
+
+
+class InvalidLineReporter:
+    """Console sink for lines skipped by the reader."""
+
+    def __init__(self, limit=MAX_INVALID_WARNINGS):
+        self.count = 0
+        self.limit = limit
+
+    def report(self, line_number, line):
+        """
+        Print a warning for a skipped line (up to the limit).
+
+        Args:
+            line_number (int): 1-based line number
+            line (str): Stripped content of the line
+        """
+        self.count += 1
+        if self.count <= self.limit:
+            print(f"Warning: Invalid data at line {line_number}: '{line}' - Skipping")
+        elif self.count == self.limit + 1:
+            print(
+                f"Warning: More than {self.limit} invalid lines; "
+                "further warnings are suppressed"
+            )
+
+    def print_summary(self):
+        """Print the number of skipped lines, if any."""
+        if self.count > 0:
+            print(f"\nTotal invalid entries skipped: {self.count}\n")
+
 
-def read_numbers_from_file(filename):
+def load_numbers(filename, read=read_numbers_from_file, **options):
     """
-    Read numbers from a file and return a list of valid integers.
+    Read numbers for the CLI, reporting problems on the console.
 
     Args:
         filename (str): Path to the file containing numbers
+        read (callable): Library reader accepting an on_invalid sink
+        **options: Extra keyword arguments for the reader
 
     Returns:
-        list: List of valid integers
+        list: Values returned by the reader (exits the program on I/O
+              errors)
     """
-    numbers = []
-    invalid_count = 0
-
+    reporter = InvalidLineReporter()
     try:
-        with open(filename, "r", encoding="utf-8") as file:
-            for line_number, line in enumerate(file, 1):
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        # Convert to float first, then to int to handle decimals
-                        number = int(float(line))
-                        numbers.append(number)
-                    except ValueError:
-                        invalid_count += 1
-                        print(
-                            f"Warning: Invalid data at line {line_number}: "
-                            f"'{line}' - Skipping"
-                        )
-
-        if invalid_count > 0:
-            print(f"\nTotal invalid entries skipped: {invalid_count}\n")
-
+        numbers = read(filename, on_invalid=reporter.report, **options)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         sys.exit(1)
     except (IOError, OSError) as e:
         print(f"Error reading file: {e}")
         sys.exit(1)
-
+    reporter.print_summary()
     return numbers
 
 
-def decimal_to_binary(number):
+def describe_conversion(bases, width, reverse=None):
     """
-    Convert a decimal number to binary representation using manual algorithm.
+    Describe the requested conversion for the report title.
 
     Args:
-        number (int): Decimal number to convert
+        bases (tuple): Names of the output bases
+        width (int): Two's complement width in bits (None if not used)
+        reverse (str): Name of the input base in reverse mode (None for
+            decimal input)
 
     Returns:
-        str: Binary representation (e.g., "1010" for 10)
+        str: Title such as "Decimal to Binary and Hexadecimal"
     """
-    if number == 0:
-        return "0"
-
-    # Handle negative numbers
-    is_negative = number < 0
-    number = abs(number)
-
-    binary = ""
-    while number > 0:
-        remainder = number % 2
-        binary = str(remainder) + binary
-        number = number // 2
-
-    if is_negative:
-        binary = "-" + binary
-
-    return binary
-
-
-def decimal_to_hexadecimal(number):
+    if reverse is not None:
+        description = f"{BASE_TITLES[reverse]} to Decimal"
+    else:
+        titles = [BASE_TITLES[base] for base in bases]
+        if len(titles) > 1:
+            targets = ", ".join(titles[:-1]) + " and " + titles[-1]
+        else:
+            targets = titles[0]
+        description = f"Decimal to {targets}"
+    if width is not None:
+        description += f", {width}-bit two's complement"
+    return description
+
+
+def iter_table_lines(rows, headers):
     """
-    Convert a decimal number to hexadecimal representation using manual algorithm.
+    Yield the lines of a conversion table one at a time.
 
     Args:
-        number (int): Decimal number to convert
+        rows (list): Tuples of cells, one per conversion
+        headers (tuple): Column titles
 
-    Returns:
-        str: Hexadecimal representation (e.g., "A" for 10)
-    """
-    if number == 0:
-        return "0"
-
-    # Handle negative numbers
-    is_negative = number < 0
-    number = abs(number)
-
-    # Hexadecimal digits mapping
-    hex_digits = "0123456789ABCDEF"
-    hexadecimal = ""
-
-    while number > 0:
-        remainder = number % 16
-        hexadecimal = hex_digits[remainder] + hexadecimal
-        number = number // 16
-
-    if is_negative:
-        hexadecimal = "-" + hexadecimal
-
-    return hexadecimal
-
-
-def format_conversion_table(conversions):
+    Yields:
+        str: Each line of the table (without newline)
     """
-    Format conversions into a table string.
-
-    Args:
-        conversions (list): List of tuples (decimal, binary, hexadecimal)
-
-    Returns:
-        str: Formatted table
-    """
-    # Calculate column widths
-    max_decimal_width = max(len(str(conv[0])) for conv in conversions)
-    max_binary_width = max(len(conv[1]) for conv in conversions)
-    max_hex_width = max(len(conv[2]) for conv in conversions)
-
-    # Ensure minimum widths for headers
-    decimal_width = max(max_decimal_width, len("Decimal"))
-    binary_width = max(max_binary_width, len("Binary"))
-    hex_width = max(max_hex_width, len("Hexadecimal"))
-
-    # Build table
-    separator = (
-        "+"
-        + "-" * (decimal_width + 2)
-        + "+"
-        + "-" * (binary_width + 2)
-        + "+"
-        + "-" * (hex_width + 2)
-        + "+"
-    )
-
-    header = (
-        f"| {'Decimal':<{decimal_width}} | "
-        f"{'Binary':<{binary_width}} | "
-        f"{'Hexadecimal':<{hex_width}} |"
-    )
-
-    table = separator + "\n" + header + "\n" + separator + "\n"
-
-    for decimal, binary, hexadecimal in conversions:
-        row = (
-            f"| {str(decimal):<{decimal_width}} | "
-            f"{binary:<{binary_width}} | "
-            f"{hexadecimal:<{hex_width}} |"
+    # Calculate column widths, ensuring minimum widths for headers
+    widths = [len(header) for header in headers]
+    for row in rows:
+        for index, cell in enumerate(row):
+            widths[index] = max(widths[index], len(str(cell)))
+
+    def format_row(cells):
+        return (
+            "| "
+            + " | ".join(f"{str(cell):<{width}}" for cell, width in zip(cells, widths))
+            + " |"
         )
-        table += row + "\n"
 
-    table += separator
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
 
-    return table
+    yield separator
+    yield format_row(headers)
+    yield separator
+    for row in rows:
+        yield format_row(row)
+    yield separator
 
 
-def save_results(filename, conversions, elapsed_time):
+def save_results(filename, rows, elapsed_time, headers, title):
     """
-    Save conversion results to a file.
+    Save conversion results to a file, writing the table line by line.
 
     Args:
         filename (str): Output filename
-        conversions (list): List of tuples (decimal, binary, hexadecimal)
+        rows (list): Tuples of cells, one per conversion
         elapsed_time (float): Execution time in seconds
+        headers (tuple): Column titles
+        title (str): Description of the conversion
     """
     try:
         with open(filename, "w", encoding="utf-8") as file:
             file.write("=" * 70 + "\n")
-            file.write(
-                "NUMBER CONVERSION RESULTS (Decimal to Binary and Hexadecimal)\n"
-            )
+            file.write(f"NUMBER CONVERSION RESULTS ({title})\n")
             file.write("=" * 70 + "\n\n")
-            file.write(f"Total numbers converted: {len(conversions)}\n\n")
+            file.write(f"Total numbers converted: {len(rows)}\n\n")
 
             # Write conversion table
-            table = format_conversion_table(conversions)
-            file.write(table)
+            for line in iter_table_lines(rows, headers):
+                file.write(line + "\n")
 
-            file.write(f"\n\nExecution Time: {elapsed_time:.6f} seconds\n")
+            file.write(f"\nExecution Time: {elapsed_time:.6f} seconds\n")
             file.write("=" * 70 + "\n")
 
         print(f"\nResults saved to '{filename}'")
@@ -202,35 +188,83 @@ def save_results(filename, conversions, elapsed_time):
         print(f"Error saving results: {e}")
 
 
-def display_results(conversions, elapsed_time):
+def display_results(rows, elapsed_time, headers, title):
     """
-    Display conversion results on console.
+    Display conversion results on console, printing the table line by line.
 
     Args:
-        conversions (list): List of tuples (decimal, binary, hexadecimal)
+        rows (list): Tuples of cells, one per conversion
         elapsed_time (float): Execution time in seconds
+        headers (tuple): Column titles
+        title (str): Description of the conversion
     """
     print("\n" + "=" * 70)
-    print("NUMBER CONVERSION RESULTS (Decimal to Binary and Hexadecimal)")
+    print(f"NUMBER CONVERSION RESULTS ({title})")
     print("=" * 70)
-    print(f"Total numbers converted: {len(conversions)}\n")
+    print(f"Total numbers converted: {len(rows)}\n")
 
     # Display conversion table
-    table = format_conversion_table(conversions)
-    print(table)
+    for line in iter_table_lines(rows, headers):
+        print(line)
 
     print(f"\n\nExecution Time: {elapsed_time:.6f} seconds")
     print("=" * 70)
 
 
+def parse_arguments(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="convertNumbers.py",
+        description="Convert a file of decimal numbers to other bases, "
+        "or numbers in another base back to decimal.",
+    )
+    parser.add_argument("filename", help="file with one number per line")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--bases",
+        default=",".join(DEFAULT_BASES),
+        metavar="LIST",
+        help="comma-separated output bases, from "
+        f"{', '.join(BASES)} (default: {','.join(DEFAULT_BASES)})",
+    )
+    mode.add_argument(
+        "--reverse",
+        choices=tuple(BASES),
+        metavar="BASE",
+        help="read numbers written in BASE (one of "
+        f"{', '.join(BASES)}) and convert them to decimal",
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        metavar="BITS",
+        help="write (or, with --reverse, read) numbers as BITS-bit two's "
+        "complement, zero-padded (default: '-' plus the magnitude for "
+        "negatives)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        args.bases = parse_base_list(args.bases)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.width is not None and args.width < 1:
+        parser.error("--width must be at least 1")
+    return args
+
+
 def main():
     """Main function to execute the number conversion."""
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python convertNumbers.py <filename>")
-        sys.exit(1)
+    args = parse_arguments(sys.argv[1:])
 
-    input_filename = sys.argv[1]
+    input_filename = args.filename
     output_filename = "ConvertionResults.txt"
 
     # Start timing
@@ -239,29 +273,42 @@ def main():
     print(f"Reading data from '{input_filename}'...")
 
     # Read numbers from file
-    numbers = read_numbers_from_file(input_filename)
+    if args.reverse is not None:
+        # Parsing the digits is the conversion; rows are (digits, decimal)
+        rows = load_numbers(
+            input_filename,
+            read_encoded_numbers_from_file,
+            base=args.reverse,
+            width=args.width,
+        )
+        headers = (BASE_TITLES[args.reverse], "Decimal")
+    else:
+        rows = load_numbers(input_filename)
+        headers = ("Decimal",) + tuple(BASE_TITLES[base] for base in args.bases)
 
-    if not numbers:
+    if not rows:
         print("Error: No valid numbers found in the file.")
         sys.exit(1)
 
-    print(f"Successfully read {len(numbers)} numbers.")
+    print(f"Successfully read {len(rows)} numbers.")
     print("Converting numbers...")
 
     # Convert all numbers
-    conversions = []
-    for number in numbers:
-        binary = decimal_to_binary(number)
-        hexadecimal = decimal_to_hexadecimal(number)
-        conversions.append((number, binary, hexadecimal))
+    if args.reverse is None:
+        try:
+            rows = convert_numbers(rows, args.bases, args.width)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
 
     # End timing
     end_time = time.time()
     elapsed_time = end_time - start_time
 
     # Display and save results
-    display_results(conversions, elapsed_time)
-    save_results(output_filename, conversions, elapsed_time)
+    title = describe_conversion(args.bases, args.width, args.reverse)
+    display_results(rows, elapsed_time, headers, title)
+    save_results(output_filename, rows, elapsed_time, headers, title)
 
 
 if __name__ == "__main__":
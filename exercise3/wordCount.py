@@ -13,248 +13,192 @@ Note: Module name 'wordCount' is required by assignment specification
 
 # pylint: disable=invalid-name
 
+import argparse
+import importlib
+import os
 import sys
 import time
 
+from compressed_input import detect_compression
+from word_count_core import (
+    NGRAM_MAX_ENTRIES,
+    NGramCounter,
+    RankedWords,
+    calculate_statistics,
+    count_word_frequencies,
+    count_word_frequencies_compact,
+    iter_line_words_from_file,
+    sort_by_frequency,
+)
 
-def is_valid_word_character(char):
-    """
-    Check if a character is valid for a word (letter or apostrophe).
-
-    Args:
-        char (str): Character to check
 
-    Returns:
-        bool: True if character is valid for a word
-    """
-    # Letters (a-z, A-Z) and apostrophes are valid
-    return char.isalpha() or char == "'"
+class ErrorLineReporter:
+    """Console sink for lines skipped by the reader."""
 
+    def __init__(self):
+        self.count = 0
 
-def extract_words_from_line(line):
-    """
-    Extract words from a line of text manually.
+    def report(self, line_number, error):
+        """
+        Print a warning for a skipped line.
 
-    Args:
-        line (str): Line of text
+        Args:
+            line_number (int): 1-based line number
+            error (Exception): Error raised while processing the line
+        """
+        self.count += 1
+        print(f"Warning: Error processing line {line_number}: {error} - Skipping")
 
-    Returns:
-        list: List of words extracted from the line
-    """
-    words = []
-    current_word = ""
+    def print_summary(self):
+        """Print the number of skipped lines, if any."""
+        if self.count > 0:
+            print(f"\nTotal lines with errors: {self.count}\n")
 
-    for char in line:
-        if is_valid_word_character(char):
-            current_word += char
-        else:
-            # End of word - save it if not empty
-            if current_word:
-                words.append(current_word.lower())
-                current_word = ""
 
-    # Don't forget the last word if line doesn't end with delimiter
-    if current_word:
-        words.append(current_word.lower())
+def exit_on_read_error(filename, error):
+    """
+    Report an I/O error on the console and exit.
 
-    return words
+    Args:
+        filename (str): Path of the input file
+        error (OSError): Error raised while reading it
+    """
+    if isinstance(error, FileNotFoundError):
+        print(f"Error: File '{filename}' not found.")
+    else:
+        print(f"Error reading file: {error}")
+    sys.exit(1)
 
 
-def read_words_from_file(filename):
+def stream_line_words(filename):
     """
-    Read words from a file and return a list of all words.
+    Read the words of each line for the CLI, reporting problems.
 
     Args:
         filename (str): Path to the file containing text
 
-    Returns:
-        list: List of all words (in lowercase)
+    Yields:
+        list: Words of one line (exits the program on I/O errors)
     """
-    all_words = []
-    invalid_lines = 0
-
+    reporter = ErrorLineReporter()
     try:
-        with open(filename, "r", encoding="utf-8") as file:
-            for line_number, line in enumerate(file, 1):
-                line = line.strip()
-                if line:  # Skip empty lines
-                    try:
-                        words = extract_words_from_line(line)
-                        all_words.extend(words)
-                    except (UnicodeDecodeError, ValueError) as e:
-                        invalid_lines += 1
-                        print(
-                            f"Warning: Error processing line "
-                            f"{line_number}: {e} - Skipping"
-                        )
-
-        if invalid_lines > 0:
-            print(f"\nTotal lines with errors: {invalid_lines}\n")
-
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found.")
-        sys.exit(1)
-    except (IOError, OSError) as e:
-        print(f"Error reading file: {e}")
-        sys.exit(1)
+        yield from iter_line_words_from_file(filename, reporter.report)
+    except OSError as e:
+        exit_on_read_error(filename, e)
+    reporter.print_summary()
 
-    return all_words
 
-
-def count_word_frequencies(words):
+def stream_words(filename):
     """
-    Count the frequency of each word manually (no Counter library).
+    Read words for the CLI, reporting problems on the console.
 
     Args:
-        words (list): List of words
+        filename (str): Path to the file containing text
 
-    Returns:
-        dict: Dictionary with word as key and frequency as value
+    Yields:
+        str: Each word (exits the program on I/O errors)
     """
-    frequency = {}
-
-    for word in words:
-        if word in frequency:
-            frequency[word] += 1
-        else:
-            frequency[word] = 1
-
-    return frequency
+    for words in stream_line_words(filename):
+        yield from words
 
 
-def sort_by_frequency(frequency_dict):
+def count_words_parallel(filename, workers):
     """
-    Sort words by frequency (descending) manually, then alphabetically.
+    Run the parallel backend, reporting problems on the console.
+
+    The backend is imported on first use so plain runs do not load the
+    multiprocessing machinery.
 
     Args:
-        frequency_dict (dict): Dictionary of word frequencies
+        filename (str): Path to the file containing text
+        workers (int): Number of worker processes
 
     Returns:
-        list: List of tuples (word, frequency) sorted by frequency desc,
-              then alphabetically
+        tuple: (frequency dictionary, sorted list of (word, frequency),
+                total words)
     """
-    # Convert dictionary to list of tuples
-    items = []
-    for word, freq in frequency_dict.items():
-        items.append((word, freq))
-
-    # Manual sorting using bubble sort (educational purpose)
-    # Sort by frequency (descending), then by word (ascending)
-    n = len(items)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            # Compare frequencies (higher first)
-            # If same frequency, compare words alphabetically
-            if items[j][1] < items[j + 1][1] or (
-                items[j][1] == items[j + 1][1] and items[j][0] > items[j + 1][0]
-            ):
-                items[j], items[j + 1] = items[j + 1], items[j]
-
-    return items
-
-
-def format_results_table(sorted_words):
+    backend = importlib.import_module("word_count_parallel")
+    reporter = ErrorLineReporter()
+    try:
+        if detect_compression(filename):
+            print("Note: compressed input is counted by a single process.")
+        frequency_dict, sorted_words, total_words, _ = backend.count_words_parallel(
+            filename, workers, reporter.report
+        )
+    except OSError as e:
+        exit_on_read_error(filename, e)
+    reporter.print_summary()
+    return frequency_dict, sorted_words, total_words
+
+
+def iter_table_lines(sorted_words, unit="word"):
     """
-    Format word frequency results into a table string.
+    Yield the lines of the word frequency table one at a time.
+
+    The ranking is read twice (once for the column widths, once for the
+    rows) and never held as a whole, so a disk-backed ranking from the
+    external mode stays on disk.
 
     Args:
-        sorted_words (list): List of tuples (word, frequency)
+        sorted_words (iterable): Re-iterable (word, frequency) pairs
+        unit (str): Name of the counted item, used as the column heading
 
-    Returns:
-        str: Formatted table
+    Yields:
+        str: Each line of the table (without newline)
     """
-    # Calculate column widths
-    max_word_width = max(len(word) for word, _ in sorted_words)
-    max_freq_width = max(len(str(freq)) for _, freq in sorted_words)
+    heading = unit.capitalize()
 
-    # Ensure minimum widths for headers
-    word_width = max(max_word_width, len("Word"))
-    freq_width = max(max_freq_width, len("Frequency"))
+    # Calculate column widths, ensuring minimum widths for headers
+    word_width = len(heading)
+    freq_width = len("Frequency")
+    for word, frequency in sorted_words:
+        word_width = max(word_width, len(word))
+        freq_width = max(freq_width, len(str(frequency)))
 
-    # Build table
     separator = "+" + "-" * (word_width + 2) + "+" + "-" * (freq_width + 2) + "+"
 
-    header = f"| {'Word':<{word_width}} | {'Frequency':>{freq_width}} |"
-
-    table = separator + "\n" + header + "\n" + separator + "\n"
-
+    yield separator
+    yield f"| {heading:<{word_width}} | {'Frequency':>{freq_width}} |"
+    yield separator
     for word, frequency in sorted_words:
-        row = f"| {word:<{word_width}} | {frequency:>{freq_width}} |"
-        table += row + "\n"
-
-    table += separator
+        yield f"| {word:<{word_width}} | {frequency:>{freq_width}} |"
+    yield separator
 
-    return table
 
-
-def calculate_statistics(frequency_dict, total_words):
+def save_results(filename, sorted_words, stats, elapsed_time, unit="word"):
     """
-    Calculate word count statistics.
-
-    Args:
-        frequency_dict (dict): Dictionary of word frequencies
-        total_words (int): Total number of words
-
-    Returns:
-        dict: Dictionary containing various statistics
-    """
-    distinct_words = len(frequency_dict)
-
-    # Find most frequent word(s) using max builtin
-    if frequency_dict:
-        max_frequency = max(frequency_dict.values())
-    else:
-        max_frequency = 0
-
-    most_frequent = []
-    for word, freq in frequency_dict.items():
-        if freq == max_frequency:
-            most_frequent.append(word)
-
-    # Sort most frequent words alphabetically
-    most_frequent = sorted(most_frequent)
-
-    return {
-        "total_words": total_words,
-        "distinct_words": distinct_words,
-        "most_frequent_words": most_frequent,
-        "max_frequency": max_frequency,
-    }
-
-
-def save_results(filename, sorted_words, stats, elapsed_time):
-    """
-    Save word count results to a file.
+    Save word count results to a file, writing the table line by line.
 
     Args:
         filename (str): Output filename
         sorted_words (list): List of tuples (word, frequency)
         stats (dict): Statistics dictionary
         elapsed_time (float): Execution time in seconds
+        unit (str): Name of the counted item (e.g. "word", "2-gram")
     """
     try:
         with open(filename, "w", encoding="utf-8") as file:
             file.write("=" * 70 + "\n")
-            file.write("WORD FREQUENCY ANALYSIS RESULTS\n")
+            file.write(f"{unit.upper()} FREQUENCY ANALYSIS RESULTS\n")
             file.write("=" * 70 + "\n\n")
 
             # Write statistics
             file.write("STATISTICS:\n")
-            file.write(f"Total words: {stats['total_words']}\n")
-            file.write(f"Distinct words: {stats['distinct_words']}\n")
+            file.write(f"Total {unit}s: {stats['total_words']}\n")
+            file.write(f"Distinct {unit}s: {stats['distinct_words']}\n")
             file.write(
-                f"Most frequent word(s): "
+                f"Most frequent {unit}(s): "
                 f"{', '.join(stats['most_frequent_words'])}\n"
             )
             file.write(f"Maximum frequency: {stats['max_frequency']}\n\n")
 
             # Write frequency table
-            file.write("WORD FREQUENCY TABLE:\n")
+            file.write(f"{unit.upper()} FREQUENCY TABLE:\n")
             file.write("(Sorted by frequency descending, then alphabetically)\n\n")
-            table = format_results_table(sorted_words)
-            file.write(table)
+            for line in iter_table_lines(sorted_words, unit):
+                file.write(line + "\n")
 
-            file.write(f"\n\nExecution Time: {elapsed_time:.6f} seconds\n")
+            file.write(f"\nExecution Time: {elapsed_time:.6f} seconds\n")
             file.write("=" * 70 + "\n")
 
         print(f"\nResults saved to '{filename}'")
@@ -262,58 +206,182 @@ def save_results(filename, sorted_words, stats, elapsed_time):
         print(f"Error saving results: {e}")
 
 
-def display_results(sorted_words, stats, elapsed_time):
+def display_results(sorted_words, stats, elapsed_time, unit="word"):
     """
-    Display word count results on console.
+    Display word count results on console, printing the table line by line.
 
     Args:
         sorted_words (list): List of tuples (word, frequency)
         stats (dict): Statistics dictionary
         elapsed_time (float): Execution time in seconds
+        unit (str): Name of the counted item (e.g. "word", "2-gram")
     """
     print("\n" + "=" * 70)
-    print("WORD FREQUENCY ANALYSIS RESULTS")
+    print(f"{unit.upper()} FREQUENCY ANALYSIS RESULTS")
     print("=" * 70)
 
     # Display statistics
     print("\nSTATISTICS:")
-    print(f"Total words: {stats['total_words']}")
-    print(f"Distinct words: {stats['distinct_words']}")
-    print(f"Most frequent word(s): " f"{', '.join(stats['most_frequent_words'])}")
+    print(f"Total {unit}s: {stats['total_words']}")
+    print(f"Distinct {unit}s: {stats['distinct_words']}")
+    print(f"Most frequent {unit}(s): " f"{', '.join(stats['most_frequent_words'])}")
     print(f"Maximum frequency: {stats['max_frequency']}")
 
     # Display frequency table
-    print("\nWORD FREQUENCY TABLE:")
+    print(f"\n{unit.upper()} FREQUENCY TABLE:")
     print("(Sorted by frequency descending, then alphabetically)\n")
-    table = format_results_table(sorted_words)
-    print(table)
+    for line in iter_table_lines(sorted_words, unit):
+        print(line)
 
     print(f"\n\nExecution Time: {elapsed_time:.6f} seconds")
     print("=" * 70)
 
 
+def parse_arguments(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="wordCount.py",
+        description="Identify distinct words in a file and their frequency.",
+    )
+    parser.add_argument("filename", help="text file to analyze")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--compact",
+        action="store_true",
+        help="count into a compact interned table (large vocabularies)",
+    )
+    mode.add_argument(
+        "--ngram",
+        type=int,
+        metavar="N",
+        help="count sequences of N consecutive words instead of single words",
+    )
+    parser.add_argument(
+        "--cross-lines",
+        action="store_true",
+        help="with --ngram, let n-grams span line boundaries",
+    )
+    parser.add_argument(
+        "--max-entries",
+        type=int,
+        default=NGRAM_MAX_ENTRIES,
+        metavar="M",
+        help="distinct entries kept in memory before rare n-grams are "
+        "pruned (--ngram) or sorted runs are spilled to disk (--external) "
+        f"(default: {NGRAM_MAX_ENTRIES})",
+    )
+    mode.add_argument(
+        "--external",
+        action="store_true",
+        help="count out of core, spilling sorted runs to temporary files "
+        "(vocabularies larger than RAM)",
+    )
+    mode.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="count in parallel with N worker processes "
+        "(0 uses every available core)",
+    )
+    args = parser.parse_args(argv)
+    if args.ngram is not None and args.ngram < 1:
+        parser.error("--ngram must be at least 1")
+    if args.max_entries < 2:
+        parser.error("--max-entries must be at least 2")
+    if args.workers is not None:
+        if args.workers < 0:
+            parser.error("--workers must not be negative")
+        if args.workers == 0:
+            args.workers = os.cpu_count() or 1
+    return args
+
+
+def analyze_words(args):
+    """
+    Count and rank the words of the input file using the selected mode.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        tuple: (frequency table, ranked (word, frequency) pairs, total
+                words); the table is None when the file has no words
+    """
+    if args.ngram is not None:
+        counter = NGramCounter(args.ngram, args.max_entries)
+        counter.count_lines(
+            stream_line_words(args.filename), args.cross_lines
+        )
+        if counter.prune_floor:
+            print(
+                f"Note: {counter.pruned_entries} rare n-grams were pruned to "
+                f"stay within {args.max_entries} entries; counts may be "
+                f"underestimated by up to {counter.max_error()}."
+            )
+        total_words = counter.total
+        sorted_words = counter.ranked()
+        frequency_dict = dict(sorted_words)
+    elif args.external:
+        backend = importlib.import_module("word_count_external")
+        sorted_words, total_words = backend.count_words_external(
+            stream_words(args.filename), args.max_entries
+        )
+        # The disk-backed ranking also serves as the frequency table
+        frequency_dict = sorted_words
+    elif args.workers is not None:
+        frequency_dict, sorted_words, total_words = count_words_parallel(
+            args.filename, args.workers
+        )
+    elif args.compact:
+        frequency_dict = count_word_frequencies_compact(
+            stream_words(args.filename)
+        )
+        total_words = frequency_dict.total
+        # Rank word IDs without building per-word tuples
+        sorted_words = RankedWords(frequency_dict, frequency_dict.rank())
+    else:
+        words = list(stream_words(args.filename))
+        total_words = len(words)
+
+        # Count word frequencies
+        frequency_dict = count_word_frequencies(words)
+
+        # Sort by frequency
+        sorted_words = sort_by_frequency(frequency_dict)
+
+    if total_words == 0:
+        return None, [], 0
+    return frequency_dict, sorted_words, total_words
+
+
 def main():
     """Main function to execute the word count analysis."""
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python wordCount.py <filename>")
-        sys.exit(1)
+    args = parse_arguments(sys.argv[1:])
 
-    input_filename = sys.argv[1]
+    input_filename = args.filename
     output_filename = "WordCountResults.txt"
 
     # Start timing
     start_time = time.time()
 
+    unit = "word" if args.ngram is None else f"{args.ngram}-gram"
+
     print(f"Reading data from '{input_filename}'...")
 
-    # Read words from file
-    words = read_words_from_file(input_filename)
+    # Count and rank words
+    frequency_dict, sorted_words, total_words = analyze_words(args)
 
-    if not words:
-        print("Warning: No valid words found in the file.")
+    if frequency_dict is None:
+        print(f"Warning: No valid {unit}s found in the file.")
         # Create empty results
-        sorted_words = []
         stats = {
             "total_words": 0,
             "distinct_words": 0,
@@ -321,25 +389,19 @@ def main():
             "max_frequency": 0,
         }
     else:
-        print(f"Successfully read {len(words)} words.")
+        print(f"Successfully read {total_words} {unit}s.")
         print("Analyzing word frequencies...")
 
-        # Count word frequencies
-        frequency_dict = count_word_frequencies(words)
-
-        # Sort by frequency
-        sorted_words = sort_by_frequency(frequency_dict)
-
         # Calculate statistics
-        stats = calculate_statistics(frequency_dict, len(words))
+        stats = calculate_statistics(frequency_dict, total_words)
 
     # End timing
     end_time = time.time()
     elapsed_time = end_time - start_time
 
     # Display and save results
-    display_results(sorted_words, stats, elapsed_time)
-    save_results(output_filename, sorted_words, stats, elapsed_time)
+    display_results(sorted_words, stats, elapsed_time, unit)
+    save_results(output_filename, sorted_words, stats, elapsed_time, unit)
 
 
 if __name__ == "__main__":
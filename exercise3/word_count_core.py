@@ -0,0 +1,617 @@
+"""
+Word Frequency Library
+
+Side-effect-free word counting routines used by wordCount.py: the
+tokenizer, readers for plain and compressed files, dictionary, compact
+and n-gram counters, and the frequency ranking. Nothing here prints or
+exits; readers raise on I/O errors and report skipped lines through an
+optional sink. The parallel and external modes live in
+word_count_parallel.py and word_count_external.py.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+from array import array
+
+from compressed_input import open_text_input
+
+# Default number of distinct entries kept in memory before pruning/spilling
+NGRAM_MAX_ENTRIES = 1000000
+# Bits used per word ID when packing an n-gram into one integer key
+NGRAM_ID_BITS = 32
+
+
+def is_valid_word_character(char):
+    """
+    Check if a character is valid for a word (letter or apostrophe).
+
+    Args:
+        char (str): Character to check
+
+    Returns:
+        bool: True if character is valid for a word
+    """
+    # Letters (a-z, A-Z) and apostrophes are valid
+    return char.isalpha() or char == "'"
+
+
+def extract_words_from_line(line):
+    """
+    Extract words from a line of text manually.
+
+    Args:
+        line (str): Line of text
+
+    Returns:
+        list: List of words extracted from the line
+    """
+    words = []
+    current_word = ""
+
+    for char in line:
+        if is_valid_word_character(char):
+            current_word += char
+        else:
+            # End of word - save it if not empty
+            if current_word:
+                words.append(current_word.lower())
+                current_word = ""
+
+    # Don't forget the last word if line doesn't end with delimiter
+    if current_word:
+        words.append(current_word.lower())
+
+    return words
+
+
+def check_line_encoding(line):
+    """
+    Check that a line read with errors="surrogateescape" was valid UTF-8.
+
+    Undecodable bytes are escaped as lone surrogates, so the original
+    bytes are decoded again to raise the same error a strict read would.
+
+    Args:
+        line (str): Line as read from the file
+
+    Raises:
+        UnicodeDecodeError: If the line held invalid UTF-8
+    """
+    if not line.isascii():
+        line.encode("utf-8", "surrogateescape").decode("utf-8")
+
+
+def iter_line_words_from_file(filename, on_error=None):
+    """
+    Lazily read a file, yielding the words of each non-empty line.
+
+    Args:
+        filename (str): Path to the file containing text
+        on_error (callable): Optional sink called as
+            on_error(line_number, error) for each skipped line
+
+    Yields:
+        list: Words of one line (in lowercase)
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    # Undecodable lines are skipped one by one instead of ending the read
+    with open_text_input(filename, "surrogateescape") as file:
+        for line_number, line in enumerate(file, 1):
+            stripped = line.strip()
+            if stripped:  # Skip empty lines
+                try:
+                    check_line_encoding(line)
+                    words = extract_words_from_line(stripped)
+                except (UnicodeDecodeError, ValueError) as e:
+                    if on_error is not None:
+                        on_error(line_number, e)
+                    continue
+                yield words
+
+
+def iter_words_from_file(filename, on_error=None):
+    """
+    Lazily read words from a file, yielding each word in order.
+
+    Args:
+        filename (str): Path to the file containing text
+        on_error (callable): Optional sink called as
+            on_error(line_number, error) for each skipped line
+
+    Yields:
+        str: Each word (in lowercase)
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    for words in iter_line_words_from_file(filename, on_error):
+        yield from words
+
+
+def read_words_from_file(filename, on_error=None):
+    """
+    Read words from a file and return a list of all words.
+
+    Args:
+        filename (str): Path to the file containing text
+        on_error (callable): Optional sink called as
+            on_error(line_number, error) for each skipped line
+
+    Returns:
+        list: List of all words (in lowercase)
+
+    Raises:
+        OSError: If the file cannot be opened, read or decompressed
+    """
+    return list(iter_words_from_file(filename, on_error))
+
+
+def count_word_frequencies(words):
+    """
+    Count the frequency of each word manually (no Counter library).
+
+    Args:
+        words (list): List of words
+
+    Returns:
+        dict: Dictionary with word as key and frequency as value
+    """
+    frequency = {}
+
+    for word in words:
+        if word in frequency:
+            frequency[word] += 1
+        else:
+            frequency[word] = 1
+
+    return frequency
+
+
+class WordFrequencyTable:
+    """
+    Compact word frequency store with integer word IDs.
+
+    The text of every distinct word lives once in a single UTF-8 byte
+    arena; offsets, hashes and counts are typed arrays indexed by word ID,
+    and an open-addressing index maps words to IDs. Each distinct word
+    costs a few machine words instead of a str key, an int value and a
+    dict entry. The table mirrors the dict methods used by this program
+    (len, in, get, items, values), so it can stand in for the dictionary
+    returned by count_word_frequencies.
+    """
+
+    def __init__(self, capacity=1024):
+        # Word i occupies arena[offsets[i]:offsets[i + 1]]
+        self._arena = bytearray()
+        self._offsets = array("Q", [0])
+        self._hashes = array("q")
+        self.counts = array("L")
+        # Slot -> word ID, -1 marks an empty slot (capacity is a power of 2)
+        size = 8
+        while size < capacity:
+            size *= 2
+        self._slots = array("q", [-1]) * size
+        self.total = 0
+        self.max_word_length = 0
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __contains__(self, word):
+        return self.lookup(word) >= 0
+
+    def __iter__(self):
+        for word_id in range(len(self.counts)):
+            yield self.word(word_id)
+
+    def _word_bytes(self, word_id):
+        """Return the arena slice holding a word's UTF-8 bytes."""
+        return self._arena[self._offsets[word_id] : self._offsets[word_id + 1]]
+
+    def _find_slot(self, key, key_hash):
+        """Return the slot holding key, or the empty slot where it belongs."""
+        mask = len(self._slots) - 1
+        slot = key_hash & mask
+        while True:
+            word_id = self._slots[slot]
+            if word_id < 0 or (
+                self._hashes[word_id] == key_hash and self._word_bytes(word_id) == key
+            ):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        """Double the index and re-insert every word ID using stored hashes."""
+        self._slots = array("q", [-1]) * (len(self._slots) * 2)
+        mask = len(self._slots) - 1
+        for word_id, key_hash in enumerate(self._hashes):
+            slot = key_hash & mask
+            while self._slots[slot] >= 0:
+                slot = (slot + 1) & mask
+            self._slots[slot] = word_id
+
+    def lookup(self, word):
+        """
+        Return the ID of a word.
+
+        Args:
+            word (str): Word to look up
+
+        Returns:
+            int: Word ID, or -1 if the word has not been counted
+        """
+        key = word.encode("utf-8")
+        return self._slots[self._find_slot(key, hash(key))]
+
+    def add(self, word, count=1):
+        """
+        Increment the frequency of a word, interning it on first sight.
+
+        Args:
+            word (str): Word to count
+            count (int): Amount to add to the word's frequency
+
+        Returns:
+            int: Word ID
+        """
+        key = word.encode("utf-8")
+        key_hash = hash(key)
+        slot = self._find_slot(key, key_hash)
+        word_id = self._slots[slot]
+
+        if word_id < 0:
+            word_id = len(self.counts)
+            self._arena += key
+            self._offsets.append(len(self._arena))
+            self._hashes.append(key_hash)
+            self.counts.append(0)
+            self._slots[slot] = word_id
+            self.max_word_length = max(self.max_word_length, len(word))
+            if len(self.counts) * 2 > len(self._slots):
+                self._grow()
+
+        self.counts[word_id] += count
+        self.total += count
+        return word_id
+
+    def word(self, word_id):
+        """
+        Return the text of a word ID.
+
+        Args:
+            word_id (int): Word ID
+
+        Returns:
+            str: The word
+        """
+        return self._word_bytes(word_id).decode("utf-8")
+
+    def get(self, word, default=0):
+        """
+        Return the frequency of a word.
+
+        Args:
+            word (str): Word to look up
+            default (int): Value returned for unknown words
+
+        Returns:
+            int: Frequency of the word
+        """
+        word_id = self.lookup(word)
+        return self.counts[word_id] if word_id >= 0 else default
+
+    def values(self):
+        """Return the counts array, indexed by word ID."""
+        return self.counts
+
+    def items(self):
+        """Yield (word, frequency) pairs in ID (first-seen) order."""
+        for word_id, count in enumerate(self.counts):
+            yield self.word(word_id), count
+
+    def _prefix(self, word_id):
+        """Return a key ordering words by their first two UTF-8 bytes."""
+        start = self._offsets[word_id]
+        second = 0
+        if self._offsets[word_id + 1] - start > 1:
+            # Shift by one so a missing second byte sorts first
+            second = self._arena[start + 1] + 1
+        return (self._arena[start] << 9) | second
+
+    @staticmethod
+    def _group_by(ids, key, reverse=False):
+        """
+        Stable counting sort of word IDs by a small integer key.
+
+        Args:
+            ids (array): Word IDs
+            key (callable): Maps a word ID to its key
+            reverse (bool): Order keys from highest to lowest
+
+        Returns:
+            tuple: (array of word IDs grouped by key, list of (start, end)
+                    bounds of each group in key order)
+        """
+        keys = array("L", map(key, ids))
+        sizes = {}
+        for value in keys:
+            sizes[value] = sizes.get(value, 0) + 1
+
+        positions = {}
+        bounds = []
+        position = 0
+        for value in sorted(sizes, reverse=reverse):
+            positions[value] = position
+            bounds.append((position, position + sizes[value]))
+            position += sizes[value]
+
+        grouped = array("L", [0]) * position
+        for word_id, value in zip(ids, keys):
+            grouped[positions[value]] = word_id
+            positions[value] += 1
+        return grouped, bounds
+
+    def rank(self):
+        """
+        Rank word IDs by frequency (descending), then alphabetically.
+
+        Word IDs are grouped by frequency with a counting sort into one
+        array, and each group is grouped again by its words' first two
+        bytes. Only those small subgroups are then sorted on their arena
+        bytes; UTF-8 byte order matches Python string order, so ties are
+        broken exactly like sort_by_frequency. Sort keys exist for one
+        subgroup at a time, so the peak memory beyond the table is a few
+        word-ID and key arrays (8 bytes per distinct word each) plus the
+        keys of the largest subgroup, instead of a key object per
+        distinct word (about 8 MB instead of 29 MB for 240,000 words).
+
+        Returns:
+            array: Word IDs in rank order
+        """
+        order, groups = self._group_by(
+            array("L", range(len(self.counts))),
+            self.counts.__getitem__,
+            reverse=True,
+        )
+        for start, end in groups:
+            if end - start < 2:
+                continue
+            group, subgroups = self._group_by(order[start:end], self._prefix)
+            for low, high in subgroups:
+                if high - low > 1:
+                    group[low:high] = array(
+                        "L", sorted(group[low:high], key=self._word_bytes)
+                    )
+            order[start:end] = group
+        return order
+
+
+class RankedWords:
+    """
+    Re-iterable (word, frequency) view over a ranked WordFrequencyTable.
+
+    Words are decoded from the arena on the fly, so the ranking can be
+    formatted and saved without building a list of per-word tuples.
+    """
+
+    def __init__(self, table, order):
+        self.table = table
+        self.order = order
+
+    def __len__(self):
+        return len(self.order)
+
+    def __iter__(self):
+        counts = self.table.counts
+        for word_id in self.order:
+            yield self.table.word(word_id), counts[word_id]
+
+
+def count_word_frequencies_compact(words):
+    """
+    Count word frequencies into a compact WordFrequencyTable.
+
+    Args:
+        words (iterable): Stream of words
+
+    Returns:
+        WordFrequencyTable: Table with the frequency of each word
+    """
+    table = WordFrequencyTable()
+    for word in words:
+        table.add(word)
+    return table
+
+
+class NGramCounter:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded-memory n-gram frequency counter.
+
+    Words are interned in a WordFrequencyTable and each n-gram is keyed by
+    its word IDs packed into a single integer, so an entry costs one int
+    and one count instead of a tuple of strings. When the table grows past
+    max_entries, entries are discarded under a rising count floor until it
+    is back to half the budget, as in Lossy Counting: an n-gram first
+    counted after a prune may have been dropped before, so it records the
+    floor at insertion as its error term, and an entry is dropped once its
+    count plus error term no longer exceeds the floor. Every kept count is
+    then a lower bound, at most its error term below the true count.
+    """
+
+    def __init__(self, n, max_entries=NGRAM_MAX_ENTRIES):
+        self.n = n
+        self.max_entries = max_entries
+        self.vocabulary = WordFrequencyTable()
+        self.counts = {}
+        # Error terms of entries inserted after a prune (absent means 0)
+        self.errors = {}
+        self.total = 0
+        # Highest count that has been discarded (0 means counts are exact)
+        self.prune_floor = 0
+        self.pruned_entries = 0
+
+    def count_lines(self, lines, cross_lines=False):
+        """
+        Count the n-grams of a stream of tokenized lines.
+
+        Args:
+            lines (iterable): Stream of word lists, one per line
+            cross_lines (bool): Let n-grams span line boundaries
+        """
+        mask = (1 << (NGRAM_ID_BITS * self.n)) - 1
+        key = 0
+        filled = 0
+
+        for words in lines:
+            if not cross_lines:
+                filled = 0
+            for word in words:
+                # Shift the newest word ID in; the mask drops the oldest
+                word_id = self.vocabulary.add(word)
+                key = ((key << NGRAM_ID_BITS) | word_id) & mask
+                filled += 1
+                if filled >= self.n:
+                    if key in self.counts:
+                        self.counts[key] += 1
+                    else:
+                        self.counts[key] = 1
+                        if self.prune_floor:
+                            # Up to prune_floor occurrences may have been dropped
+                            self.errors[key] = self.prune_floor
+                    self.total += 1
+                    if len(self.counts) > self.max_entries:
+                        self._prune()
+
+    def _prune(self):
+        """Discard rare n-grams until the table is at half its budget."""
+        while len(self.counts) > self.max_entries // 2:
+            self.prune_floor += 1
+            survivors = {}
+            errors = {}
+            for key, count in self.counts.items():
+                error = self.errors.get(key, 0)
+                if count + error > self.prune_floor:
+                    survivors[key] = count
+                    if error:
+                        errors[key] = error
+            self.pruned_entries += len(self.counts) - len(survivors)
+            self.counts = survivors
+            self.errors = errors
+
+    def max_error(self):
+        """
+        Return the largest undercount of any kept n-gram.
+
+        Returns:
+            int: Maximum error term (0 means every count is exact)
+        """
+        return max(self.errors.values(), default=0)
+
+    def phrase(self, key):
+        """
+        Decode a packed n-gram key into its words.
+
+        Args:
+            key (int): Packed word IDs
+
+        Returns:
+            str: The n-gram as space-separated words
+        """
+        id_mask = (1 << NGRAM_ID_BITS) - 1
+        words = []
+        for _ in range(self.n):
+            words.append(self.vocabulary.word(key & id_mask))
+            key >>= NGRAM_ID_BITS
+        return " ".join(reversed(words))
+
+    def ranked(self):
+        """
+        Rank n-grams by frequency (descending), then alphabetically.
+
+        Returns:
+            list: List of tuples (n-gram, frequency)
+        """
+        items = [(self.phrase(key), count) for key, count in self.counts.items()]
+        return sorted(items, key=frequency_rank_key)
+
+
+def sort_by_frequency(frequency_dict):
+    """
+    Sort words by frequency (descending) manually, then alphabetically.
+
+    Args:
+        frequency_dict (dict): Dictionary of word frequencies
+
+    Returns:
+        list: List of tuples (word, frequency) sorted by frequency desc,
+              then alphabetically
+    """
+    # Convert dictionary to list of tuples
+    items = []
+    for word, freq in frequency_dict.items():
+        items.append((word, freq))
+
+    # Manual sorting using bubble sort (educational purpose)
+    # Sort by frequency (descending), then by word (ascending)
+    n = len(items)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            # Compare frequencies (higher first)
+            # If same frequency, compare words alphabetically
+            if items[j][1] < items[j + 1][1] or (
+                items[j][1] == items[j + 1][1] and items[j][0] > items[j + 1][0]
+            ):
+                items[j], items[j + 1] = items[j + 1], items[j]
+
+    return items
+
+
+def frequency_rank_key(item):
+    """
+    Sort key matching sort_by_frequency: frequency desc, then word asc.
+
+    Args:
+        item (tuple): (word, frequency)
+
+    Returns:
+        tuple: Key ordering higher frequencies first, ties alphabetically
+    """
+    return -item[1], item[0]
+
+
+def calculate_statistics(frequency_dict, total_words):
+    """
+    Calculate word count statistics.
+
+    Args:
+        frequency_dict (dict): Dictionary of word frequencies
+        total_words (int): Total number of words
+
+    Returns:
+        dict: Dictionary containing various statistics
+    """
+    distinct_words = len(frequency_dict)
+
+    # Find most frequent word(s) using max builtin
+    if frequency_dict:
+        max_frequency = max(frequency_dict.values())
+    else:
+        max_frequency = 0
+
+    most_frequent = []
+    for word, freq in frequency_dict.items():
+        if freq == max_frequency:
+            most_frequent.append(word)
+
+    # Sort most frequent words alphabetically
+    most_frequent = sorted(most_frequent)
+
+    return {
+        "total_words": total_words,
+        "distinct_words": distinct_words,
+        "most_frequent_words": most_frequent,
+        "max_frequency": max_frequency,
+    }
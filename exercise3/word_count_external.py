@@ -0,0 +1,245 @@
+"""
+External-Memory Word Counting
+
+Optional disk-backed backend for wordCount.py. Counts are spilled to
+sorted runs in temporary files and k-way merged, so the vocabulary never
+has to fit in memory.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import heapq
+import tempfile
+
+from word_count_core import frequency_rank_key
+
+# Maximum number of sorted runs merged at once by the external mode
+MERGE_FAN_IN = 64
+
+
+def write_run(items):
+    """
+    Write (word, frequency) pairs to an anonymous temporary file.
+
+    Words never contain tabs or newlines, so one "word<TAB>count" line per
+    entry is unambiguous. The file is deleted automatically when closed.
+
+    Args:
+        items (iterable): Pairs in the order they should be read back
+
+    Returns:
+        file: Temporary file holding the run
+    """
+    # pylint: disable=consider-using-with
+    run = tempfile.TemporaryFile("w+", encoding="utf-8", newline="\n")
+    for word, freq in items:
+        run.write(f"{word}\t{freq}\n")
+    return run
+
+
+def read_run(run):
+    """
+    Read back a run written by write_run.
+
+    Args:
+        run (file): Temporary run file
+
+    Yields:
+        tuple: (word, frequency)
+    """
+    run.seek(0)
+    for line in run:
+        word, freq = line.rstrip("\n").split("\t")
+        yield word, int(freq)
+
+
+def merge_runs(runs, key, combine):
+    """
+    K-way merge sorted runs, merging in passes of at most MERGE_FAN_IN.
+
+    Args:
+        runs (list): Temporary run files, each sorted by key
+        key (callable): Sort key shared by every run
+        combine (bool): Sum the frequencies of equal words (runs sorted by
+            word) instead of passing entries through
+
+    Yields:
+        tuple: (word, frequency) in key order
+    """
+    while len(runs) > MERGE_FAN_IN:
+        groups = [
+            runs[index : index + MERGE_FAN_IN]
+            for index in range(0, len(runs), MERGE_FAN_IN)
+        ]
+        runs = [write_run(merge_runs(group, key, combine)) for group in groups]
+
+    merged = heapq.merge(*(read_run(run) for run in runs), key=key)
+    if combine:
+        current_word = None
+        current_freq = 0
+        for word, freq in merged:
+            if word == current_word:
+                current_freq += freq
+                continue
+            if current_word is not None:
+                yield current_word, current_freq
+            current_word = word
+            current_freq = freq
+        if current_word is not None:
+            yield current_word, current_freq
+    else:
+        yield from merged
+
+    for run in runs:
+        run.close()
+
+
+def word_key(item):
+    """
+    Sort key ordering (word, frequency) pairs alphabetically by word.
+
+    Args:
+        item (tuple): (word, frequency)
+
+    Returns:
+        str: The word
+    """
+    return item[0]
+
+
+def add_run(levels, run, key, combine):
+    """
+    Add a sorted run, compacting full levels to bound open files.
+
+    Runs are grouped in levels; once a level holds MERGE_FAN_IN runs they
+    are merged into a single run on the next level, so only about
+    MERGE_FAN_IN runs per level are ever open at once.
+
+    Args:
+        levels (list): Lists of run files, one list per level
+        run (file): New sorted run
+        key (callable): Sort key shared by every run
+        combine (bool): Sum frequencies of equal words while compacting
+    """
+    level = 0
+    while True:
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(run)
+        if len(levels[level]) < MERGE_FAN_IN:
+            return
+        run = write_run(merge_runs(levels[level], key, combine))
+        levels[level] = []
+        level += 1
+
+
+def spill_sorted_runs(items, max_entries, key):
+    """
+    Split a stream of pairs into sorted runs of at most max_entries each.
+
+    Args:
+        items (iterable): Stream of (word, frequency) pairs
+        max_entries (int): Entries sorted in memory per run
+        key (callable): Sort key for each run
+
+    Returns:
+        list: Temporary run files
+    """
+    levels = []
+    buffer = []
+    for item in items:
+        buffer.append(item)
+        if len(buffer) >= max_entries:
+            add_run(levels, write_run(sorted(buffer, key=key)), key, False)
+            buffer = []
+    if buffer or not levels:
+        add_run(levels, write_run(sorted(buffer, key=key)), key, False)
+    return [run for level in levels for run in level]
+
+
+class SpilledRanking:
+    """
+    Disk-backed (word, frequency) ranking produced by the external mode.
+
+    Iterating re-reads the ranked run file, so the object can be passed
+    both as the sorted word list and as the frequency table used by
+    calculate_statistics (len, values, items) without loading it into
+    memory. Only one iteration may be active at a time.
+    """
+
+    def __init__(self, run, distinct_words):
+        self.run = run
+        self.distinct_words = distinct_words
+
+    def __len__(self):
+        return self.distinct_words
+
+    def __iter__(self):
+        return read_run(self.run)
+
+    def items(self):
+        """Yield (word, frequency) pairs in rank order."""
+        return iter(self)
+
+    def values(self):
+        """Yield frequencies in rank order."""
+        return (freq for _, freq in self)
+
+    def close(self):
+        """Delete the ranked run file."""
+        self.run.close()
+
+
+def count_words_external(words, max_entries):
+    """
+    Count and rank word frequencies without holding the vocabulary in RAM.
+
+    Words are counted in memory until max_entries distinct words are
+    held; the table is then written to disk as a run sorted by word. The
+    runs are k-way merged to sum counts, re-sorted externally by frequency
+    (descending) then word, and merged once more into the final ranking,
+    which is identical to the in-memory path.
+
+    Args:
+        words (iterable): Stream of words
+        max_entries (int): Distinct words kept in memory at once
+
+    Returns:
+        tuple: (SpilledRanking, total words)
+    """
+    levels = []
+    frequency = {}
+    total_words = 0
+
+    for word in words:
+        total_words += 1
+        if word in frequency:
+            frequency[word] += 1
+        else:
+            frequency[word] = 1
+            if len(frequency) >= max_entries:
+                run = write_run(sorted(frequency.items(), key=word_key))
+                add_run(levels, run, word_key, True)
+                frequency = {}
+    if frequency or not levels:
+        add_run(levels, write_run(sorted(frequency.items(), key=word_key)), word_key, True)
+    runs = [run for level in levels for run in level]
+    frequency = None
+
+    distinct_words = 0
+
+    def counted(merged):
+        nonlocal distinct_words
+        for item in merged:
+            distinct_words += 1
+            yield item
+
+    rank_runs = spill_sorted_runs(
+        counted(merge_runs(runs, word_key, combine=True)),
+        max_entries,
+        frequency_rank_key,
+    )
+    ranked = write_run(merge_runs(rank_runs, frequency_rank_key, combine=False))
+
+    return SpilledRanking(ranked, distinct_words), total_words
@@ -0,0 +1,255 @@
+"""
+Parallel Word Counting
+
+Optional multi-process backend for wordCount.py. Line-aligned byte ranges
+of the input are counted by worker processes into hash-partitioned
+tables, and each partition is merged and ranked in parallel.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import heapq
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from compressed_input import detect_compression
+from word_count_core import (
+    count_word_frequencies,
+    extract_words_from_line,
+    frequency_rank_key,
+    iter_words_from_file,
+)
+
+# Upper bound on the bytes a parallel worker reads at once
+PARALLEL_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def word_partition(word, partitions):
+    """
+    Return the partition that owns a word.
+
+    A CRC32 of the UTF-8 bytes is used instead of hash() so every worker
+    process assigns a word to the same partition.
+
+    Args:
+        word (str): Word to place
+        partitions (int): Number of partitions
+
+    Returns:
+        int: Partition index
+    """
+    return zlib.crc32(word.encode("utf-8")) % partitions
+
+
+def split_file_on_lines(filename, chunks):
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        filename (str): Path to the file
+        chunks (int): Desired number of ranges
+
+    Returns:
+        list: List of (start, end) byte offsets covering the whole file
+    """
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, "rb") as file:
+        for index in range(1, chunks):
+            position = max(size * index // chunks, boundaries[-1])
+            if position == 0:
+                continue
+            # Back up one byte so a range starting exactly on a line is kept
+            file.seek(position - 1)
+            file.readline()
+            boundary = file.tell()
+            if boundaries[-1] < boundary < size:
+                boundaries.append(boundary)
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def partition_table(frequency, partitions):
+    """
+    Split a frequency dictionary into hash partitions.
+
+    Args:
+        frequency (dict): Dictionary with word as key and count as value
+        partitions (int): Number of partitions
+
+    Returns:
+        list: One dictionary per partition
+    """
+    tables = [{} for _ in range(partitions)]
+    for word, freq in frequency.items():
+        tables[word_partition(word, partitions)][word] = freq
+    return tables
+
+
+def count_chunk(filename, start, end, partitions):
+    """
+    Worker: count the words of one byte range into partitioned tables.
+
+    Words are counted into one dictionary first, so each distinct word is
+    hashed to its partition once rather than once per occurrence.
+
+    Args:
+        filename (str): Path to the file
+        start (int): First byte of the range (a line start)
+        end (int): End of the range (a line start or end of file)
+        partitions (int): Number of hash partitions
+
+    Returns:
+        tuple: (list of partition dictionaries, total words, list of
+                (line number within the range, error) for skipped lines,
+                number of lines in the range)
+    """
+    frequency = {}
+    total_words = 0
+    skipped = []
+
+    with open(filename, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    # Like the text reader's universal newlines, "\n", "\r\n" and a bare
+    # "\r" all end a line (bytes.splitlines recognizes exactly these). Line
+    # ends are kept so decoding errors read as they do in the serial path
+    lines = data.splitlines(keepends=True)
+    for line_number, raw_line in enumerate(lines, 1):
+        try:
+            line = raw_line.decode("utf-8").strip()
+        except UnicodeDecodeError as e:
+            skipped.append((line_number, e))
+            continue
+        if not line:
+            continue
+        for word in extract_words_from_line(line):
+            if word in frequency:
+                frequency[word] += 1
+            else:
+                frequency[word] = 1
+            total_words += 1
+
+    return (
+        partition_table(frequency, partitions),
+        total_words,
+        skipped,
+        len(lines),
+    )
+
+
+def merge_partition(tables):
+    """
+    Worker: merge one partition from every chunk and rank it.
+
+    Args:
+        tables (list): Dictionaries holding the same partition
+
+    Returns:
+        list: List of tuples (word, frequency) in sort_by_frequency order
+    """
+    merged = {}
+    for table in tables:
+        for word, freq in table.items():
+            merged[word] = merged.get(word, 0) + freq
+    return sorted(merged.items(), key=frequency_rank_key)
+
+
+def report_skipped_lines(results, on_error):
+    """
+    Pass the lines skipped by chunk workers to a sink in file order.
+
+    Args:
+        results (list): count_chunk results, in file order
+        on_error (callable): Sink called as on_error(line_number, error),
+            or None
+
+    Returns:
+        int: Number of skipped lines
+    """
+    invalid_lines = 0
+    first_line = 0
+    for _, _, skipped, line_count in results:
+        invalid_lines += len(skipped)
+        if on_error is not None:
+            for line_number, error in skipped:
+                on_error(first_line + line_number, error)
+        first_line += line_count
+    return invalid_lines
+
+
+def count_words_parallel(filename, workers, on_error=None):
+    """
+    Count and rank word frequencies using several processes.
+
+    Workers count line-aligned chunks of the file into hash-partitioned
+    tables; each partition is then merged and ranked in parallel. Because
+    partitions hold disjoint words, a k-way merge of the ranked partitions
+    gives exactly the sort_by_frequency ordering.
+
+    Args:
+        filename (str): Path to the file containing text
+        workers (int): Number of worker processes
+        on_error (callable): Optional sink called as
+            on_error(line_number, error) for each skipped line, in file
+            order
+
+    Returns:
+        tuple: (frequency dictionary, sorted list of (word, frequency),
+                total words, invalid lines)
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    size = os.path.getsize(filename)
+
+    if detect_compression(filename):
+        # A compressed stream cannot be split at byte offsets
+        invalid_lines = 0
+
+        def skipped(line_number, error):
+            nonlocal invalid_lines
+            invalid_lines += 1
+            if on_error is not None:
+                on_error(line_number, error)
+
+        frequency_dict = count_word_frequencies(
+            iter_words_from_file(filename, skipped)
+        )
+        sorted_words = sorted(frequency_dict.items(), key=frequency_rank_key)
+        return (
+            frequency_dict,
+            sorted_words,
+            sum(frequency_dict.values()),
+            invalid_lines,
+        )
+
+    chunks = max(workers * 4, size // PARALLEL_CHUNK_BYTES + 1)
+    ranges = split_file_on_lines(filename, chunks)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(
+            pool.map(
+                count_chunk,
+                [filename] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [workers] * len(ranges),
+            )
+        )
+        # Regroup so each merge task receives one partition from every chunk
+        partitions = [
+            [result[0][index] for result in results] for index in range(workers)
+        ]
+        ranked_partitions = list(pool.map(merge_partition, partitions))
+
+    total_words = sum(result[1] for result in results)
+    invalid_lines = report_skipped_lines(results, on_error)
+
+    sorted_words = list(heapq.merge(*ranked_partitions, key=frequency_rank_key))
+    return dict(sorted_words), sorted_words, total_words, invalid_lines
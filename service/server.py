@@ -0,0 +1,571 @@
+"""
+Analysis Service
+
+Long-running asyncio HTTP service exposing the three programs of this
+repository (statistics, number conversion and word count) without paying
+interpreter startup on every request. CPU work runs in a process pool,
+results for unchanged files are cached, and throughput/latency counters
+are available at /metrics.
+
+Author: Alejandro Díaz
+Date: February 2026
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bytes read from the socket at a time while spooling a request body
+BODY_CHUNK_SIZE = 64 * 1024
+# Results kept for repeated requests on unchanged files
+RESULT_CACHE_SIZE = 256
+# Conversions each worker process keeps warm across requests
+CONVERSION_CACHE_SIZE = 65536
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    500: "Internal Server Error",
+}
+
+
+def load_library(directory, name):
+    """
+    Import the library module of one of the exercises.
+
+    The exercises are standalone directories rather than packages, so the
+    directory is put on the import path (which also lets the library load
+    its optional backends) before importing the module.
+
+    Args:
+        directory (str): Exercise directory relative to the repository root
+        name (str): Module name (file name without ".py")
+
+    Returns:
+        module: The loaded library module
+    """
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.append(path)
+    return importlib.import_module(name)
+
+
+statistics_core = load_library("exercise1", "statistics_core")
+conversion_core = load_library("exercise2", "conversion_core")
+word_count_core = load_library("exercise3", "word_count_core")
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def convert_number(number):
+    """
+    Convert a number to binary and hexadecimal, memoized per worker.
+
+    Args:
+        number (int): Decimal number
+
+    Returns:
+        tuple: (binary, hexadecimal)
+    """
+    return conversion_core.get_converter().convert(number)
+
+
+def invalid_data_sink(messages):
+    """
+    Build a reader sink that records skipped number lines.
+
+    Args:
+        messages (list): Message list to append to
+
+    Returns:
+        callable: Sink accepting (line_number, line)
+    """
+
+    def report(line_number, line):
+        messages.append(
+            f"Warning: Invalid data at line {line_number}: '{line}' - Skipping"
+        )
+
+    return report
+
+
+def compute_statistics(path, _top, messages):
+    """
+    Worker: descriptive statistics for a file of numbers.
+
+    Args:
+        path (str): Input file
+        _top (int): Unused (accepted for a uniform signature)
+        messages (list): Receives warnings about skipped lines
+
+    Returns:
+        dict: Statistics results
+    """
+    # NaN and infinity have no JSON representation; skip them like the
+    # rolling and binned modes do
+    numbers = list(
+        statistics_core.iter_numbers_from_file(
+            path, statistics_core.parse_finite_number, invalid_data_sink(messages)
+        )
+    )
+    if not numbers:
+        raise ValueError("No valid numbers found in the file.")
+
+    result = statistics_core.compute_statistics(numbers)
+    result["mode"] = result.pop("modes")
+    return result
+
+
+def convert_numbers(path, top, messages):
+    """
+    Worker: binary and hexadecimal conversion of a file of numbers.
+
+    Args:
+        path (str): Input file
+        top (int): Maximum number of conversions returned (None for all)
+        messages (list): Receives warnings about skipped lines
+
+    Returns:
+        dict: Conversion results
+    """
+    numbers = conversion_core.read_numbers_from_file(
+        path, invalid_data_sink(messages)
+    )
+    if not numbers:
+        raise ValueError("No valid numbers found in the file.")
+
+    conversions = [[number, *convert_number(number)] for number in numbers[:top]]
+    return {"count": len(numbers), "conversions": conversions}
+
+
+def count_words(path, top, messages):
+    """
+    Worker: word frequency analysis of a text file.
+
+    Args:
+        path (str): Input file
+        top (int): Maximum number of ranked words returned (None for all)
+        messages (list): Receives warnings about skipped lines
+
+    Returns:
+        dict: Word count statistics and ranking
+    """
+
+    def report(line_number, error):
+        messages.append(
+            f"Warning: Error processing line {line_number}: {error} - Skipping"
+        )
+
+    frequency = word_count_core.count_word_frequencies(
+        word_count_core.iter_words_from_file(path, report)
+    )
+    total_words = sum(frequency.values())
+    ranking = sorted(frequency.items(), key=word_count_core.frequency_rank_key)
+    result = word_count_core.calculate_statistics(frequency, total_words)
+    result["ranking"] = [list(item) for item in ranking[:top]]
+    return result
+
+
+OPERATIONS = {
+    "/statistics": compute_statistics,
+    "/convert": convert_numbers,
+    "/wordcount": count_words,
+}
+
+
+def run_operation(route, path, top):
+    """
+    Worker entry point: run one operation in-process.
+
+    The libraries raise instead of exiting and report skipped lines
+    through a sink, so both end up in the response.
+
+    Args:
+        route (str): Operation route (key of OPERATIONS)
+        path (str): Input file
+        top (int): Maximum number of rows returned (None for all)
+
+    Returns:
+        tuple: (HTTP status, response dictionary)
+    """
+    messages = []
+    try:
+        result = OPERATIONS[route](path, top, messages)
+    except FileNotFoundError:
+        result = {"error": f"File '{path}' not found."}
+        status = 400
+    except (OSError, ValueError) as e:
+        result = {"error": str(e)}
+        status = 400
+    except OverflowError:
+        # Squaring values near 1e300 overflows; the data is at fault
+        result = {"error": "Result is not a finite number."}
+        status = 400
+    else:
+        status = 200
+
+    result["messages"] = messages
+    return status, result
+
+
+def encode_response(status, payload):
+    """
+    Encode a response dictionary as strict JSON.
+
+    Results that overflow to infinity (for example the variance of values
+    near 1e300) cannot be written as JSON, so they become a 400 response.
+
+    Args:
+        status (int): HTTP status of the response
+        payload (dict): Response dictionary
+
+    Returns:
+        tuple: (HTTP status, UTF-8 encoded body)
+    """
+    try:
+        body = json.dumps(payload, allow_nan=False)
+    except ValueError:
+        status = 400
+        body = json.dumps({"error": "Result is not a finite number."})
+    return status, body.encode("utf-8")
+
+
+class ServiceMetrics:
+    """Throughput and latency counters for each route."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.in_flight = 0
+        self.cache_hits = 0
+        self.routes = {}
+
+    def record(self, route, status, latency):
+        """
+        Record a completed request.
+
+        Args:
+            route (str): Request route
+            status (int): HTTP status returned
+            latency (float): Seconds spent handling the request
+        """
+        counters = self.routes.setdefault(
+            route,
+            {"requests": 0, "errors": 0, "total_latency": 0.0, "max_latency": 0.0},
+        )
+        counters["requests"] += 1
+        if status >= 400:
+            counters["errors"] += 1
+        counters["total_latency"] += latency
+        counters["max_latency"] = max(counters["max_latency"], latency)
+
+    def snapshot(self):
+        """
+        Return the counters as a JSON-serializable dictionary.
+
+        Returns:
+            dict: Uptime, throughput and per-route latency counters
+        """
+        uptime = time.monotonic() - self.started
+        completed = sum(counters["requests"] for counters in self.routes.values())
+        routes = {}
+        for route, counters in self.routes.items():
+            routes[route] = dict(
+                counters,
+                mean_latency=counters["total_latency"] / counters["requests"],
+            )
+        return {
+            "uptime_seconds": uptime,
+            "requests_completed": completed,
+            "requests_in_flight": self.in_flight,
+            "throughput_per_second": completed / uptime if uptime > 0 else 0.0,
+            "result_cache_hits": self.cache_hits,
+            "routes": routes,
+        }
+
+
+class AnalysisService:
+    """HTTP front end dispatching requests to a worker process pool."""
+
+    def __init__(self, workers):
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.metrics = ServiceMetrics()
+        self.results = OrderedDict()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one HTTP request on a connection, then close it.
+
+        Args:
+            reader (asyncio.StreamReader): Connection input
+            writer (asyncio.StreamWriter): Connection output
+        """
+        start_time = time.monotonic()
+        self.metrics.in_flight += 1
+        route = None
+        try:
+            try:
+                request_line = await reader.readline()
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = await self.read_headers(reader)
+                url = urlsplit(target)
+                route = url.path
+                status, payload = await self.dispatch(method, url, headers, reader)
+            except ValueError:
+                status, payload = 400, {"error": "Malformed request."}
+            except ConnectionError:
+                status, payload = None, None
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # A failing worker (or a broken pool) must still answer
+                print(f"Error handling request: {e!r}", file=sys.stderr)
+                status, payload = 500, {"error": "Internal server error."}
+            finally:
+                self.metrics.in_flight -= 1
+
+            if status is not None:
+                status, body = encode_response(status, payload)
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n".encode("latin-1") + body
+                )
+                with contextlib.suppress(ConnectionError):
+                    await writer.drain()
+                if route in OPERATIONS or route == "/metrics":
+                    self.metrics.record(route, status, time.monotonic() - start_time)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    @staticmethod
+    async def read_headers(reader):
+        """
+        Read HTTP headers up to the blank line.
+
+        Args:
+            reader (asyncio.StreamReader): Connection input
+
+        Returns:
+            dict: Header names (lowercase) to values
+        """
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def dispatch(self, method, url, headers, reader):
+        """
+        Route a request to the metrics endpoint or an operation.
+
+        Args:
+            method (str): HTTP method
+            url (urllib.parse.SplitResult): Request target
+            headers (dict): Request headers
+            reader (asyncio.StreamReader): Connection input (request body)
+
+        Returns:
+            tuple: (HTTP status, response dictionary)
+        """
+        route = url.path
+        if route == "/metrics":
+            if method != "GET":
+                return 405, {"error": "Use GET for /metrics."}
+            return 200, self.metrics.snapshot()
+        if route not in OPERATIONS:
+            return 404, {"error": f"Unknown route '{route}'."}
+        if method != "POST":
+            return 405, {"error": f"Use POST for {route}."}
+        return await self.run_request(route, parse_qs(url.query), headers, reader)
+
+    async def run_request(self, route, query, headers, reader):
+        """
+        Run an operation on a server-side path or an uploaded body.
+
+        Operations take their input either from a "path" query parameter
+        or from the request body, which is streamed to a temporary file
+        (plain or compressed) as it arrives.
+
+        Args:
+            route (str): Operation route
+            query (dict): Parsed query parameters ("path", "top")
+            headers (dict): Request headers
+            reader (asyncio.StreamReader): Connection input (request body)
+
+        Returns:
+            tuple: (HTTP status, response dictionary)
+        """
+        top = int(query["top"][0]) if "top" in query else None
+        if "path" in query:
+            return await self.run_for_path(route, query["path"][0], top)
+        if "content-length" not in headers:
+            return 411, {"error": "Send a 'path' parameter or a request body."}
+
+        spooled = await self.spool_body(reader, int(headers["content-length"]))
+        try:
+            return await self.run_in_pool(route, spooled, top)
+        finally:
+            os.unlink(spooled)
+
+    async def run_for_path(self, route, path, top):
+        """
+        Run an operation on a server-side file, reusing cached results.
+
+        Results are keyed by the file's identity and modification time, so
+        repeated requests on an unchanged file skip the worker pool.
+
+        Args:
+            route (str): Operation route
+            path (str): Input file on the server
+            top (int): Maximum number of rows returned (None for all)
+
+        Returns:
+            tuple: (HTTP status, response dictionary)
+        """
+        try:
+            info = os.stat(path)
+        except OSError:
+            return 404, {"error": f"File '{path}' not found."}
+
+        key = (route, os.path.realpath(path), info.st_mtime_ns, info.st_size, top)
+        if key in self.results:
+            self.results.move_to_end(key)
+            self.metrics.cache_hits += 1
+            return self.results[key]
+
+        response = await self.run_in_pool(route, path, top)
+        if response[0] == 200:
+            self.results[key] = response
+            if len(self.results) > RESULT_CACHE_SIZE:
+                self.results.popitem(last=False)
+        return response
+
+    async def run_in_pool(self, route, path, top):
+        """
+        Run an operation in the worker pool without blocking the loop.
+
+        Args:
+            route (str): Operation route
+            path (str): Input file
+            top (int): Maximum number of rows returned (None for all)
+
+        Returns:
+            tuple: (HTTP status, response dictionary)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, run_operation, route, path, top)
+
+    @staticmethod
+    async def spool_body(reader, length):
+        """
+        Stream a request body to a temporary file.
+
+        Args:
+            reader (asyncio.StreamReader): Connection input
+            length (int): Content-Length of the body
+
+        Returns:
+            str: Path of the temporary file (the caller deletes it)
+        """
+        with tempfile.NamedTemporaryFile(delete=False) as spool:
+            remaining = length
+            try:
+                while remaining > 0:
+                    chunk = await reader.read(min(BODY_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise ConnectionError("request body ended early")
+                    spool.write(chunk)
+                    remaining -= len(chunk)
+            except ConnectionError:
+                os.unlink(spool.name)
+                raise
+        return spool.name
+
+    def close(self):
+        """Shut down the worker pool."""
+        self.pool.shutdown()
+
+
+async def serve(args):
+    """
+    Start the service and run until interrupted.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    service = AnalysisService(args.workers)
+    try:
+        if args.unix:
+            server = await asyncio.start_unix_server(
+                service.handle_connection, path=args.unix
+            )
+            print(f"Serving on unix socket '{args.unix}'")
+        else:
+            server = await asyncio.start_server(
+                service.handle_connection, args.host, args.port
+            )
+            print(f"Serving on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def parse_arguments(argv):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv (list): Arguments after the program name
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="server.py",
+        description="Serve statistics, conversion and word count over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a unix socket")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="worker processes for CPU work (default: one per core)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main():
+    """Main function to run the analysis service."""
+    args = parse_arguments(sys.argv[1:])
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("\nService stopped.")
+
+
+if __name__ == "__main__":
+    main()